@@ -170,4 +170,38 @@ halve = lambda x: x / 2
 result = pipeline(10, increment, square, halve)
 
 print("Pipeline result:", result)
+
+
+# Compiled pipeline: resolve the chain once, reuse it for many values
+def compose(*funcs):
+    """
+    Fuse funcs into a single callable: compose(f, g, h)(x) == h(g(f(x))).
+
+    pipeline() re-packs and walks the *funcs tuple on every call; compose()
+    builds the chain of closures once and hands back a plain one-argument
+    function, ready for map(). Nested compose() results are flattened.
+    (Module 32 has the full version that also inlines partials and
+    offers a batched apply_many().)
+    """
+    flat = []
+    for f in funcs:
+        flat.extend(getattr(f, "stages", (f,)))
+
+    def chain(inner, outer):
+        return lambda x: outer(inner(x))
+
+    fused = flat[0] if flat else (lambda x: x)
+    for f in flat[1:]:
+        fused = chain(fused, f)
+
+    def composed(x):
+        return fused(x)
+
+    composed.stages = tuple(flat)
+    return composed
+
+
+compiled = compose(increment, square, halve)
+print("Compiled pipeline result:", compiled(10))
+print("Batch:", list(map(compiled, range(5))))
 print("-" * 50)
@@ -27,7 +27,9 @@ Year: 2025
 from __future__ import annotations
 
 import asyncio
-from typing import List, AsyncIterator
+import random
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List
 
 
 # ===========================================================
@@ -247,6 +249,467 @@ async def rank5_demo() -> None:
     print("-" * 50)
 
 
+# ===========================================================
+# Rank 5+ — Performance
+# Reusable async pipeline runtime: bounded queues, worker pools,
+# batching consumers, graceful drain and per-stage metrics
+# ===========================================================
+
+class BatchQueue(asyncio.Queue):
+    """
+    asyncio.Queue with a batching `get_many`.
+
+    Example:
+        batch = await queue.get_many(max_items=100, timeout=0.05)
+    """
+
+    async def get_many(self, max_items: int, timeout: float) -> list:
+        """
+        Wait for at least one item, then keep collecting until `max_items`
+        are gathered or `timeout` seconds passed since the first one.
+        """
+        batch = [await self.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(batch) < max_items:
+            try:
+                batch.append(self.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+
+@dataclass
+class StageMetrics:
+    """Counters for one pipeline stage (filled in while the pipeline runs)."""
+
+    items: int = 0
+    batches: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    started_at: float = 0.0
+    finished_at: float = 0.0
+
+    def report(self, workers: int = 1) -> dict:
+        elapsed = max(self.finished_at - self.started_at, 1e-9)
+        return {
+            "items": self.items,
+            "batches": self.batches,
+            "errors": self.errors,
+            "throughput_per_s": self.items / elapsed,
+            "avg_latency_ms": 1000 * self.latency_total / self.items if self.items else 0.0,
+            "max_latency_ms": 1000 * self.latency_max,
+            "utilization": self.busy_seconds / (elapsed * workers),
+        }
+
+
+@dataclass
+class Stage:
+    """
+    One step of an AsyncPipeline.
+
+    - func: `async def func(item)` -> result, or when `batch_size > 1`
+      `async def func(items)` -> list of results.
+    - workers: how many consumer tasks run this stage concurrently.
+    - maxsize: bound of the stage's input queue (backpressure: producers
+      wait instead of filling memory).
+    """
+
+    name: str
+    func: Callable[[Any], Awaitable[Any]]
+    workers: int = 1
+    maxsize: int = 100
+    batch_size: int = 1
+    batch_timeout: float = 0.01
+    metrics: StageMetrics = field(default_factory=StageMetrics)
+
+
+class AsyncPipeline:
+    """
+    Run items through a chain of stages, each with its own bounded queue
+    and worker pool.
+
+    Shutdown is graceful: after the source is exhausted each stage is
+    drained (`queue.join()`) before its workers are cancelled, in order,
+    so no item is lost. `cancel()` stops everything immediately.
+
+    Example:
+        pipeline = AsyncPipeline([
+            Stage("fetch", fetch_event, workers=16),
+            Stage("save", save_events, workers=2, batch_size=50),
+        ])
+        results = await pipeline.run(range(1000))
+    """
+
+    def __init__(self, stages: List[Stage]) -> None:
+        self.stages = stages
+        self.queues = [BatchQueue(maxsize=stage.maxsize) for stage in stages]
+        self.results: list = []
+        self._tasks: List[asyncio.Task] = []
+
+    async def _worker(self, index: int) -> None:
+        stage = self.stages[index]
+        queue = self.queues[index]
+        next_queue = self.queues[index + 1] if index + 1 < len(self.queues) else None
+        loop = asyncio.get_running_loop()
+
+        while True:
+            if stage.batch_size > 1:
+                envelopes = await queue.get_many(stage.batch_size, stage.batch_timeout)
+            else:
+                envelopes = [await queue.get()]
+
+            started = loop.time()
+            try:
+                items = [item for _, item in envelopes]
+                if stage.batch_size > 1:
+                    outputs = list(await stage.func(items))
+                else:
+                    outputs = [await stage.func(items[0])]
+            except Exception:
+                stage.metrics.errors += len(envelopes)
+                outputs = []
+            finished = loop.time()
+
+            metrics = stage.metrics
+            metrics.batches += 1
+            metrics.items += len(envelopes)
+            metrics.busy_seconds += finished - started
+            metrics.finished_at = finished
+            for enqueued_at, _ in envelopes:
+                latency = finished - enqueued_at
+                metrics.latency_total += latency
+                metrics.latency_max = max(metrics.latency_max, latency)
+
+            # Hand results on BEFORE task_done(), so join() on this queue
+            # also means "everything is in the next queue".
+            for output in outputs:
+                if next_queue is None:
+                    self.results.append(output)
+                else:
+                    await next_queue.put((loop.time(), output))
+            for _ in envelopes:
+                queue.task_done()
+
+    async def run(self, source: Iterable[Any] | AsyncIterator[Any]) -> list:
+        """Feed `source` into the first stage and return the final results."""
+        loop = asyncio.get_running_loop()
+        workers_by_stage = []
+        for index, stage in enumerate(self.stages):
+            stage.metrics.started_at = loop.time()
+            tasks = [
+                asyncio.create_task(self._worker(index), name=f"{stage.name}-{n}")
+                for n in range(stage.workers)
+            ]
+            workers_by_stage.append(tasks)
+            self._tasks.extend(tasks)
+
+        try:
+            first = self.queues[0]
+            if hasattr(source, "__aiter__"):
+                async for item in source:  # type: ignore[union-attr]
+                    await first.put((loop.time(), item))
+            else:
+                for item in source:  # type: ignore[union-attr]
+                    await first.put((loop.time(), item))
+
+            # Graceful drain, stage by stage.
+            for queue, tasks in zip(self.queues, workers_by_stage):
+                await queue.join()
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.cancel()
+        return self.results
+
+    def cancel(self) -> None:
+        """Stop all workers right away (items still queued are dropped)."""
+        for task in self._tasks:
+            task.cancel()
+
+    def metrics(self) -> dict:
+        return {stage.name: stage.metrics.report(stage.workers) for stage in self.stages}
+
+
+async def run_game_event_pipeline_pooled(
+    total_events: int = 100, workers: int = 8
+) -> List[dict]:
+    """
+    `run_game_event_pipeline` on the runtime above: a bounded queue and a
+    pool of `workers` consumers instead of one consumer and a None sentinel.
+    """
+
+    async def process_event(event: dict) -> dict:
+        await asyncio.sleep(0.05)  # same simulated work as game_event_consumer
+        event["processed"] = True
+        return event
+
+    events = (
+        {
+            "id": i,
+            "player": "Peyman",
+            "game": "World of Warcraft",
+            "description": f"Event #{i} for player Peyman",
+        }
+        for i in range(1, total_events + 1)
+    )
+    pipeline = AsyncPipeline([Stage("process", process_event, workers=workers)])
+    return await pipeline.run(events)
+
+
+async def benchmark_pipeline_scaling(
+    events: int = 2000,
+    io_delay: float = 0.005,
+    worker_counts: tuple = (1, 2, 4, 8, 16, 32, 64),
+) -> None:
+    """
+    Throughput of one I/O-bound stage (asyncio.sleep per event) for a growing
+    number of workers. Expect near-linear scaling until the event loop
+    itself becomes the bottleneck.
+    """
+
+    async def fake_io(item: int) -> int:
+        await asyncio.sleep(io_delay)
+        return item
+
+    for workers in worker_counts:
+        count = events if workers >= 8 else events // 10  # keep small pools quick
+        pipeline = AsyncPipeline([Stage("io", fake_io, workers=workers, maxsize=workers * 4)])
+        await pipeline.run(range(count))
+        report = pipeline.metrics()["io"]
+        print(
+            f"workers={workers:3}  {report['throughput_per_s']:10,.0f} events/s  "
+            f"avg latency {report['avg_latency_ms']:7.1f} ms"
+        )
+
+
+async def _hedged_call(
+    func: Callable[[Any], Awaitable[Any]],
+    item: Any,
+    hedge_after: float | None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> Any:
+    """
+    Call `func(item)`. If it has not finished after `hedge_after` seconds,
+    start ONE duplicate call and return whichever succeeds first (the slow
+    tail of a few calls no longer decides the total time).
+
+    The duplicate takes its own `semaphore` slot, so hedging never pushes
+    the number of running calls above the caller's cap.
+    """
+    primary = asyncio.ensure_future(func(item))
+    if hedge_after is None:
+        return await primary
+
+    async def hedge() -> Any:
+        if semaphore is None:
+            return await func(item)
+        async with semaphore:
+            return await func(item)
+
+    tasks = {primary}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if not done:
+            tasks.add(asyncio.ensure_future(hedge()))
+
+        error: BaseException | None = None
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            succeeded = False
+            result = None
+            # Look at every finished task so no exception is left unretrieved.
+            for task in done:
+                tasks.discard(task)
+                if task.cancelled():
+                    continue
+                if task.exception() is None:
+                    if not succeeded:
+                        succeeded, result = True, task.result()
+                else:
+                    error = task.exception()
+            if succeeded:
+                return result
+        raise error if error is not None else asyncio.CancelledError()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def async_map(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    *,
+    concurrency: int = 10,
+    call_timeout: float | None = None,
+    deadline: float | None = None,
+    retries: int = 0,
+    backoff: float = 0.1,
+    max_backoff: float = 2.0,
+    hedge_after: float | None = None,
+) -> AsyncIterator[tuple[int, Any]]:
+    """
+    Bounded, fault-tolerant fan-out: `run_multiple_matches` for thousands
+    of slow calls.
+
+    - At most `concurrency` calls run at once (semaphore), and only a small
+      window of tasks exists at any time, so huge inputs are fine.
+    - `call_timeout`: limit per attempt (like `run_with_timeout`).
+    - `deadline`: limit for the whole map, in seconds.
+    - `retries`: extra attempts after a failure/timeout, waiting a random
+      ("full jitter") time up to `backoff * 2**attempt` (capped) in between.
+    - `hedge_after`: see `_hedged_call`. A hedged duplicate waits for its
+      own semaphore slot, so it never exceeds `concurrency` either.
+
+    Yields `(index, result)` as soon as each call finishes. A call that
+    finally fails yields `(index, exception)` instead of raising; calls
+    cut off by the deadline yield `(index, asyncio.TimeoutError())`.
+
+    Example:
+        async for index, result in async_map(fetch, urls, concurrency=50):
+            ...
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    end_time = None if deadline is None else loop.time() + deadline
+
+    async def attempt_all(item: Any) -> Any:
+        for attempt in range(retries + 1):
+            try:
+                async with semaphore:
+                    return await asyncio.wait_for(
+                        _hedged_call(func, item, hedge_after, semaphore), call_timeout
+                    )
+            except Exception:
+                if attempt == retries:
+                    raise
+            delay = min(max_backoff, backoff * 2 ** attempt)
+            await asyncio.sleep(random.uniform(0, delay))
+
+    source = enumerate(items)
+    running: dict[asyncio.Task, int] = {}
+
+    def launch() -> None:
+        # Keep a window of 2 x concurrency tasks: enough to keep every slot
+        # busy (some tasks may be sleeping in backoff), never the whole input.
+        while len(running) < 2 * concurrency:
+            try:
+                index, item = next(source)
+            except StopIteration:
+                return
+            running[asyncio.ensure_future(attempt_all(item))] = index
+
+    launch()
+    try:
+        while running:
+            timeout = None if end_time is None else max(end_time - loop.time(), 0)
+            done, _ = await asyncio.wait(
+                running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:  # overall deadline reached
+                for task, index in running.items():
+                    task.cancel()
+                    yield index, asyncio.TimeoutError()
+                for index, _ in source:
+                    yield index, asyncio.TimeoutError()
+                running.clear()
+                return
+            for task in done:
+                index = running.pop(task)
+                error = task.exception()
+                yield index, (task.result() if error is None else error)
+            launch()
+    finally:
+        for task in running:
+            task.cancel()
+
+
+async def run_multiple_matches_bounded(
+    player_name: str, durations: List[float], concurrency: int = 10
+) -> List[str]:
+    """
+    `run_multiple_matches` with a concurrency cap; results keep input order.
+    """
+    results: List[Any] = [None] * len(durations)
+    matches = async_map(
+        lambda d: simulate_game_match(player_name, d), durations, concurrency=concurrency
+    )
+    async for index, result in matches:
+        results[index] = result
+    return results
+
+
+async def async_map_demo() -> None:
+    """
+    Demo with a local stand-in for `simulate_slow_network_call`: a flaky,
+    sometimes very slow service. Retries fix the failures, hedging cuts
+    the slow tail.
+    """
+    print("Rank 5+ — async_map (bounded fan-out)")
+    calls = 0
+
+    async def flaky_network_call(name: str) -> str:
+        nonlocal calls
+        calls += 1
+        if random.random() < 0.1:
+            raise ConnectionError(f"{name} failed")
+        await asyncio.sleep(1.0 if random.random() < 0.05 else 0.02)
+        return f"Result from {name}"
+
+    names = [f"API-{i}" for i in range(200)]
+    start = asyncio.get_running_loop().time()
+    ok = failed = 0
+    async for index, result in async_map(
+        flaky_network_call, names, concurrency=20, call_timeout=2.0,
+        retries=3, backoff=0.01, hedge_after=0.1, deadline=10.0,
+    ):
+        if isinstance(result, BaseException):
+            failed += 1
+        else:
+            assert result == f"Result from {names[index]}", result
+            ok += 1
+    elapsed = asyncio.get_running_loop().time() - start
+    print(f"{ok} ok, {failed} failed, {calls} calls in {elapsed:.2f}s")
+    # Four attempts at a 10% failure rate: expect (almost) no failures.
+    assert failed <= 2, f"{failed} calls failed after retries"
+
+    # Fast calls that finish before hedge_after must return their results,
+    # and hedged duplicates must stay inside the concurrency cap.
+    in_flight = peak = 0
+
+    async def tracked_call(x: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0.2 if x % 3 == 0 else 0.001)
+            return x * x
+        finally:
+            in_flight -= 1
+
+    results = {
+        index: result
+        async for index, result in async_map(
+            tracked_call, range(30), concurrency=4, hedge_after=0.05
+        )
+    }
+    assert results == {x: x * x for x in range(30)}, results
+    assert peak <= 4, f"{peak} calls ran at once with concurrency=4"
+    print(f"hedged fast calls: all {len(results)} correct, peak concurrency {peak}")
+    print("-" * 50)
+
+
 # ===========================================================
 # Main demo runner
 # ===========================================================
@@ -261,6 +724,7 @@ async def main_demo() -> None:
     await rank3_demo()
     await rank4_demo()
     await rank5_demo()
+    await async_map_demo()
 
 
 if __name__ == "__main__":
@@ -22,8 +22,21 @@ ID Number: 250161
 Year: 2025
 """
 
+import operator
+import random
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_right, insort
 from dataclasses import dataclass, field, asdict, replace
-from typing import List
+from functools import lru_cache
+from itertools import compress, repeat
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # optional: GradedStudentTable falls back to array + map
+    np = None
 
 
 # ===========================================================
@@ -217,3 +230,526 @@ print("Config as dict:", config_dict)
 print("Production config:", config_production)
 
 print("-" * 50)
+
+
+# ===========================================================
+# Rank 5+ — Performance
+# Timetable index: hash indexes, minute integers, interval lookups
+# ===========================================================
+
+print("Rank 5+ — Performance")
+
+MINUTES_PER_DAY = 24 * 60
+INDEXED_FIELDS = ("teacher", "room", "subject")
+INF = float("inf")  # sorts after any (start, end, id) with the same start
+
+
+@lru_cache(maxsize=4096)
+def parse_hhmm(text: str) -> int:
+    """
+    "08:50" -> 530 minutes after midnight.
+
+    A timetable repeats the same few dozen times, so the cache makes
+    parsing 100k lessons cost a few dozen real parses.
+    """
+    hours, minutes = text.split(":")
+    value = int(hours) * 60 + int(minutes)
+    if not 0 <= value <= MINUTES_PER_DAY:
+        raise ValueError(f"time out of range: {text!r}")
+    return value
+
+
+def lesson_minutes(lesson: Any) -> Tuple[int, int]:
+    """
+    (start, end) of a lesson as minutes on a weekly axis.
+
+    Works for LessonDC and the Lesson named tuple. An optional integer
+    `day` attribute (0 = Monday) shifts the lesson by whole days.
+    """
+    offset = getattr(lesson, "day", 0) * MINUTES_PER_DAY
+    start = parse_hhmm(lesson.start_time) + offset
+    end = parse_hhmm(lesson.end_time) + offset
+    if end <= start:
+        raise ValueError(f"lesson ends before it starts: {lesson!r}")
+    return start, end
+
+
+class TimetableIndex:
+    """
+    Read-mostly index over many lessons (LessonDC or Lesson tuples).
+
+    - Hash indexes teacher/room/subject -> lesson ids: O(1) + k lookups
+      instead of TimetableDC.lessons_by_teacher()'s full scan.
+    - Times are parsed once into minute integers.
+    - Per key, and globally, lessons are kept as (start, end, id) tuples
+      sorted by start. Intervals are half-open [start, end), so a lesson
+      ending at 08:50 does not clash with one starting at 08:50.
+
+    Because no lesson is longer than max_length minutes, every lesson
+    running at minute t started in (t - max_length, t]. Two bisects bound
+    that slice, so point and overlap queries cost O(log n + k), where k is
+    the number of lessons starting inside that window.
+    """
+
+    def __init__(self, lessons: Iterable[Any] = ()) -> None:
+        self.lessons: List[Any] = []
+        self.max_length = 0
+        self._by: Dict[str, Dict[str, List[int]]] = {name: {} for name in INDEXED_FIELDS}
+        self._timeline: List[Tuple[int, int, int]] = []
+        self._timelines: Dict[str, Dict[str, List[Tuple[int, int, int]]]] = {
+            name: {} for name in INDEXED_FIELDS
+        }
+        self._sorted = True
+        for lesson in lessons:
+            self._append(lesson)
+        self._sort()
+
+    @classmethod
+    def from_timetable(cls, timetable: "TimetableDC") -> "TimetableIndex":
+        return cls(timetable.lessons)
+
+    def __len__(self) -> int:
+        return len(self.lessons)
+
+    # ----- building -------------------------------------------------------
+
+    def _append(self, lesson: Any, keep_sorted: bool = False) -> int:
+        start, end = lesson_minutes(lesson)
+        lesson_id = len(self.lessons)
+        self.lessons.append(lesson)
+        if end - start > self.max_length:
+            self.max_length = end - start
+
+        # Bulk loads append and sort once in _sort(); single adds insort.
+        place = insort if keep_sorted else list.append
+        entry = (start, end, lesson_id)
+        place(self._timeline, entry)
+        for name in INDEXED_FIELDS:
+            key = getattr(lesson, name)
+            self._by[name].setdefault(key, []).append(lesson_id)
+            place(self._timelines[name].setdefault(key, []), entry)
+        if not keep_sorted:
+            self._sorted = False
+        return lesson_id
+
+    def _sort(self) -> None:
+        if self._sorted:
+            return
+        self._timeline.sort()
+        for timelines in self._timelines.values():
+            for entries in timelines.values():
+                entries.sort()
+        self._sorted = True
+
+    def add(self, lesson: Any) -> int:
+        """Insert one lesson, keeping every timeline sorted."""
+        self._sort()
+        return self._append(lesson, keep_sorted=True)
+
+    # ----- hash lookups -----------------------------------------------------
+
+    def lookup(self, field_name: str, key: str) -> List[Any]:
+        lessons = self.lessons
+        return [lessons[i] for i in self._by[field_name].get(key, ())]
+
+    def by_teacher(self, teacher: str) -> List[Any]:
+        return self.lookup("teacher", teacher)
+
+    def by_room(self, room: str) -> List[Any]:
+        return self.lookup("room", room)
+
+    def by_subject(self, subject: str) -> List[Any]:
+        return self.lookup("subject", subject)
+
+    def keys(self, field_name: str) -> List[str]:
+        """Sorted distinct teachers/rooms/subjects (cf. list_subjects())."""
+        return sorted(self._by[field_name])
+
+    # ----- interval queries -------------------------------------------------
+
+    def _overlapping(
+        self, entries: List[Tuple[int, int, int]], start: int, end: int
+    ) -> List[int]:
+        """Ids in `entries` whose [s, e) overlaps [start, end)."""
+        lo = bisect_right(entries, (start - self.max_length, INF))
+        hi = bisect_right(entries, (end - 1, INF))
+        return [i for s, e, i in entries[lo:hi] if e > start]
+
+    def lessons_at(self, when: str, day: int = 0) -> List[Any]:
+        """Lessons in progress at `when` ("09:15") on `day`."""
+        self._sort()
+        t = parse_hhmm(when) + day * MINUTES_PER_DAY
+        return [self.lessons[i] for i in self._overlapping(self._timeline, t, t + 1)]
+
+    def busy_at(self, when: str, day: int = 0, field_name: str = "teacher") -> Set[str]:
+        return {getattr(lesson, field_name) for lesson in self.lessons_at(when, day)}
+
+    def free_at(
+        self,
+        when: str,
+        day: int = 0,
+        field_name: str = "teacher",
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """
+        Who (or which room) is free at `when`.
+
+        candidates defaults to every key known to the index; the cost is
+        O(log n + k) for the busy set plus one set difference.
+        """
+        busy = self.busy_at(when, day, field_name)
+        pool = self._by[field_name] if candidates is None else candidates
+        return sorted(key for key in pool if key not in busy)
+
+    def conflicts_for(self, lesson: Any, field_name: str = "room") -> List[Any]:
+        """Existing lessons that would double-book lesson's room/teacher."""
+        self._sort()
+        start, end = lesson_minutes(lesson)
+        entries = self._timelines[field_name].get(getattr(lesson, field_name), [])
+        return [
+            self.lessons[i]
+            for i in self._overlapping(entries, start, end)
+            if self.lessons[i] is not lesson
+        ]
+
+    def double_bookings(self, field_name: str = "room") -> List[Tuple[Any, Any]]:
+        """
+        Every pair of overlapping lessons sharing a room/teacher.
+
+        One sweep per key over its start-sorted timeline: each lesson is
+        compared only with the still-running lessons before it, so the
+        cost is O(n log n + conflicts).
+        """
+        self._sort()
+        lessons = self.lessons
+        pairs: List[Tuple[Any, Any]] = []
+        for entries in self._timelines[field_name].values():
+            running: List[Tuple[int, int]] = []  # (end, id) of open lessons
+            for start, end, lesson_id in entries:
+                running = [(e, i) for e, i in running if e > start]
+                for _, other in running:
+                    pairs.append((lessons[other], lessons[lesson_id]))
+                running.append((end, lesson_id))
+        return pairs
+
+
+@dataclass
+class WeeklyLessonDC(LessonDC):
+    """LessonDC with a weekday (0 = Monday), for week-long timetables."""
+    day: int = 0
+
+
+def benchmark_timetable_index(n: int = 100_000, queries: int = 500) -> Dict[str, float]:
+    """
+    Linear scans (TimetableDC style) vs TimetableIndex on n weekly lessons.
+    Returns seconds per operation group.
+    """
+    rng = random.Random(7)
+    periods = [(8 * 60 + 55 * p, 8 * 60 + 55 * p + 50) for p in range(9)]
+    rooms = [f"R{r}" for r in range(n // 40 + 1)]
+    teachers = [f"T{t}" for t in range(n // 40 + 1)]
+    subjects = ["Math", "Physics", "English", "History", "Biology", "Art"]
+
+    def hhmm(minutes: int) -> str:
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+    lessons = []
+    for _ in range(n):
+        start, end = rng.choice(periods)
+        lessons.append(WeeklyLessonDC(
+            rng.choice(subjects), rng.choice(teachers), rng.choice(rooms),
+            hhmm(start), hhmm(end), rng.randrange(5),
+        ))
+    timetable = TimetableDC(group="ALL", lessons=lessons)
+    sample_teachers = [rng.choice(teachers) for _ in range(queries)]
+    timings: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    index = TimetableIndex.from_timetable(timetable)
+    timings["build index"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [timetable.lessons_by_teacher(t) for t in sample_teachers]
+    timings["by teacher (scan)"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [index.by_teacher(t) for t in sample_teachers]
+    timings["by teacher (index)"] = time.perf_counter() - start
+    assert scanned == indexed
+
+    def free_scan(when: str, day: int) -> List[str]:
+        t = parse_hhmm(when)
+        busy = {
+            l.teacher for l in timetable.lessons
+            if l.day == day and parse_hhmm(l.start_time) <= t < parse_hhmm(l.end_time)
+        }
+        return sorted(set(teachers) - busy)
+
+    slots = [(hhmm(rng.randrange(8 * 60, 16 * 60)), rng.randrange(5)) for _ in range(20)]
+    start = time.perf_counter()
+    free_a = [free_scan(when, day) for when, day in slots]
+    timings["free at (scan) x20"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    free_b = [index.free_at(when, day, candidates=teachers) for when, day in slots]
+    timings["free at (index) x20"] = time.perf_counter() - start
+    assert free_a == free_b
+
+    start = time.perf_counter()
+    clashes = index.double_bookings("room")
+    timings["room double-bookings"] = time.perf_counter() - start
+
+    print(f"  {n:,} lessons, {len(clashes):,} room double-bookings")
+    for name, seconds in timings.items():
+        print(f"  {name:<22} {seconds * 1000:9.2f} ms")
+    return timings
+
+
+@dataclass(slots=True)
+class GradedStudentSlots:
+    """GradedStudent without a per-instance __dict__ (memory comparison)."""
+    name: str
+    math_score: float
+    physics_score: float
+    group: str
+
+    def __post_init__(self) -> None:
+        self.group = self.group.upper().strip()
+        for field_name in ("math_score", "physics_score"):
+            value = getattr(self, field_name)
+            if not (0.0 <= value <= 10.0):
+                raise ValueError(f"{field_name} must be between 0 and 10, got {value!r}")
+
+    def average(self) -> float:
+        return (self.math_score + self.physics_score) / 2
+
+    def passed(self, min_avg: float = 6.0) -> bool:
+        return self.average() >= min_avg
+
+
+class GradedStudentRow:
+    """
+    Lightweight view of one row of a GradedStudentTable.
+
+    Holds only (table, index); fields are read from the columns on access,
+    so handing out views costs nothing per student until they are used.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "GradedStudentTable", index: int) -> None:
+        self._table = table
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._index]
+
+    @property
+    def math_score(self) -> float:
+        return self._table.math_scores[self._index]
+
+    @property
+    def physics_score(self) -> float:
+        return self._table.physics_scores[self._index]
+
+    @property
+    def group(self) -> str:
+        return self._table.groups[self._table.group_codes[self._index]]
+
+    def average(self) -> float:
+        return (self.math_score + self.physics_score) / 2
+
+    def passed(self, min_avg: float = 6.0) -> bool:
+        return self.average() >= min_avg
+
+    def to_dataclass(self) -> GradedStudent:
+        return GradedStudent(self.name, self.math_score, self.physics_score, self.group)
+
+    def __repr__(self) -> str:
+        return (
+            f"GradedStudentRow(name={self.name!r}, math_score={self.math_score}, "
+            f"physics_score={self.physics_score}, group={self.group!r})"
+        )
+
+
+class GradedStudentTable:
+    """
+    Columnar storage for many GradedStudent records.
+
+    - math_scores / physics_scores: array('d'), 8 bytes per value.
+    - group_codes: array('H') of indexes into `groups`, so "1A" is stored
+      once however many students share it (at most 65536 groups).
+    - names: list of str (the only per-row Python objects left).
+
+    Validation and group normalization match GradedStudent.__post_init__.
+    averages() and passed_mask() run over whole columns at once: through
+    NumPy (zero-copy over the arrays) when installed, else through
+    C-level map() over the arrays.
+    """
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.math_scores = array("d")
+        self.physics_scores = array("d")
+        self.group_codes = array("H")
+        self.groups: List[str] = []
+        self._group_index: Dict[str, int] = {}
+
+    @classmethod
+    def from_students(cls, students: Iterable[Any]) -> "GradedStudentTable":
+        table = cls()
+        table.extend(
+            (s.name, s.math_score, s.physics_score, s.group) for s in students
+        )
+        return table
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> GradedStudentRow:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("student index out of range")
+        return GradedStudentRow(self, index)
+
+    def __iter__(self):
+        return map(GradedStudentRow, repeat(self), range(len(self)))
+
+    def group_code(self, group: str) -> int:
+        """Intern a group name; returns its code."""
+        group = group.upper().strip()
+        code = self._group_index.get(group)
+        if code is None:
+            code = self._group_index[group] = len(self.groups)
+            self.groups.append(group)
+        return code
+
+    def append(self, name: str, math_score: float, physics_score: float, group: str) -> None:
+        for field_name, value in (("math_score", math_score), ("physics_score", physics_score)):
+            if not (0.0 <= value <= 10.0):
+                raise ValueError(f"{field_name} must be between 0 and 10, got {value!r}")
+        self.names.append(name)
+        self.math_scores.append(math_score)
+        self.physics_scores.append(physics_score)
+        self.group_codes.append(self.group_code(group))
+
+    def extend(self, rows: Iterable[Tuple[str, float, float, str]]) -> None:
+        for row in rows:
+            self.append(*row)
+
+    def averages(self) -> array:
+        """(math + physics) / 2 for every row, as array('d')."""
+        if np is not None:
+            math = np.frombuffer(self.math_scores, dtype=np.float64)
+            physics = np.frombuffer(self.physics_scores, dtype=np.float64)
+            return array("d", ((math + physics) * 0.5).tobytes())
+        sums = map(operator.add, self.math_scores, self.physics_scores)
+        return array("d", map(operator.mul, sums, repeat(0.5)))
+
+    def passed_mask(self, min_avg: float = 6.0) -> bytes:
+        """One byte per row: 1 if average >= min_avg, else 0."""
+        if np is not None:
+            averages = np.frombuffer(self.averages(), dtype=np.float64)
+            return (averages >= min_avg).astype(np.uint8).tobytes()
+        return bytes(map(operator.ge, self.averages(), repeat(min_avg)))
+
+    def passed_count(self, min_avg: float = 6.0) -> int:
+        return self.passed_mask(min_avg).count(1)
+
+    def rows_where(self, mask: bytes) -> List[GradedStudentRow]:
+        """Row views for the rows where mask is non-zero."""
+        return [GradedStudentRow(self, i) for i in compress(range(len(self)), mask)]
+
+    def rows_in_group(self, group: str) -> List[GradedStudentRow]:
+        code = self._group_index.get(group.upper().strip())
+        if code is None:
+            return []
+        return self.rows_where(bytes(map(code.__eq__, self.group_codes)))
+
+    def nbytes(self) -> int:
+        """Bytes held by the numeric columns (names excluded)."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.math_scores, self.physics_scores, self.group_codes)
+        )
+
+
+def benchmark_graded_students(n: int = 10_000_000) -> Dict[str, Dict[str, float]]:
+    """
+    Memory (tracemalloc) and average/pass-mask time for n students stored
+    as a list of GradedStudent, a list of GradedStudentSlots, and a
+    GradedStudentTable. Names are built inside each measurement, so all
+    three pay for them.
+
+    10M dataclass instances need several GB; pass a smaller n to try it
+    on a laptop.
+    """
+    groups = ["1A", "1B", "2A", "2B", "3A", "3B"]
+
+    def rows():
+        for i in range(n):
+            yield (f"Student {i}", (i * 7) % 101 / 10, (i * 13) % 101 / 10, groups[i % 6])
+
+    def measure(build):
+        tracemalloc.start()
+        data = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return data, current
+
+    results: Dict[str, Dict[str, float]] = {}
+    builders = {
+        "list[GradedStudent]": lambda: [GradedStudent(*r) for r in rows()],
+        "list[slots=True]": lambda: [GradedStudentSlots(*r) for r in rows()],
+        "GradedStudentTable": lambda: GradedStudentTable.from_students(
+            GradedStudentSlots(*r) for r in rows()
+        ),
+    }
+    pass_counts = set()
+    for name, build in builders.items():
+        data, memory = measure(build)
+        start = time.perf_counter()
+        if isinstance(data, GradedStudentTable):
+            averages = data.averages()
+            passed = data.passed_count()
+        else:
+            averages = [s.average() for s in data]
+            passed = sum(1 for s in data if s.passed())
+        elapsed = time.perf_counter() - start
+        pass_counts.add(passed)
+        results[name] = {"bytes": memory, "seconds": elapsed}
+        print(
+            f"  {name:<20} {memory / 2**20:9.1f} MiB  "
+            f"({memory / n:6.1f} B/row)  averages+passed {elapsed:7.3f}s"
+        )
+        del data, averages
+    assert len(pass_counts) == 1, "strategies disagree on pass counts"
+    return results
+
+
+index_1a = TimetableIndex.from_timetable(timetable_1a)
+print("Subjects:", index_1a.keys("subject"))
+print("Prof. Peyman:", [lesson.subject for lesson in index_1a.by_teacher("Prof. Peyman")])
+print("Free at 09:15:", index_1a.free_at("09:15"))
+clash = LessonDC("Química", "Miss Arlette", "A1", "09:00", "09:30")
+print("Conflicts for", clash.subject, "in A1:", [l.subject for l in index_1a.conflicts_for(clash)])
+index_1a.add(clash)
+print("Room double-bookings:", [(a.subject, b.subject) for a, b in index_1a.double_bookings()])
+
+table = GradedStudentTable.from_students([
+    graded_student,
+    GradedStudent("Ana", 5.5, 6.1, "1b"),
+    GradedStudent("Luis", 7.0, 6.0, "1A"),
+])
+print("Table averages:", list(table.averages()))
+print("Passed mask:", list(table.passed_mask()))
+print("Group 1A:", [row.name for row in table.rows_in_group("1a")])
+print("Row view:", table[1], "->", table[1].passed())
+
+if __name__ == "__main__":
+    benchmark_timetable_index()
+    benchmark_graded_students(n=500_000)
+
+print("-" * 50)
@@ -7,6 +7,11 @@ ID Number: 250161
 Year: 2025
 """
 
+import operator
+import time
+from itertools import accumulate, chain, islice
+from typing import Any, Callable, Iterable, Iterator
+
 
 # ===========================================================
 # Rank 1 — Beginner
@@ -159,6 +164,218 @@ def filter_ids_by_last_digit(tagged_ids, last_digit: int):
             yield tagged
 
 
+# ===========================================================
+# Rank 5+ — Performance
+# Lazy Stream API with fused map/filter stages
+# ===========================================================
+
+class Stream:
+    """
+    Lazy pipeline builder:
+
+        Stream(src).map(f).filter(p).scan(operator.add).chunk(100)
+
+    Hand-stacked generators (tag_student_ids -> filter_ids_by_last_digit)
+    pay one generator frame switch per item per stage. Here, every run of
+    adjacent map/filter steps is FUSED into one generated function with a
+    single for-loop (a generator, or with `to_list(chunk_size=...)` a list
+    builder per chunk), so an item crosses a single frame for the whole
+    run. Each step is still one call of its function, so generators that
+    inline their logic by hand stay faster. scan/chunk use the C iterators
+    from itertools.
+    """
+
+    def __init__(self, source: Iterable[Any]) -> None:
+        self._source = source
+        self._steps: list[tuple[str, Any]] = []
+
+    def _with(self, kind: str, arg: Any) -> "Stream":
+        stream = Stream(self._source)
+        stream._steps = self._steps + [(kind, arg)]
+        return stream
+
+    def map(self, func: Callable[[Any], Any]) -> "Stream":
+        return self._with("map", func)
+
+    def filter(self, predicate: Callable[[Any], Any]) -> "Stream":
+        return self._with("filter", predicate)
+
+    def scan(self, func: Callable[[Any, Any], Any], initial: Any = None) -> "Stream":
+        """Running fold, like running_total(); `initial` itself is not emitted."""
+        return self._with("scan", (func, initial))
+
+    def chunk(self, size: int) -> "Stream":
+        """Group items into tuples of `size` (the last one may be shorter)."""
+        return self._with("chunk", size)
+
+    def take(self, n: int) -> "Stream":
+        return self._with("take", n)
+
+    @staticmethod
+    def _fuse(run: list[tuple[str, Any]], as_list: bool) -> Callable[[Iterable[Any]], Iterable[Any]]:
+        """
+        Compile a run of map/filter steps into ONE function with a plain
+        for-loop, e.g. map f0, filter f1, map f2 ->
+
+            def _fused(it, f0=f0, f1=f1, f2=f2):
+                for v in it:
+                    v = f0(v)
+                    if not f1(v):
+                        continue
+                    yield f2(v)
+
+        The stage functions are bound as default arguments, so every lookup
+        is a fast local (no closure cells, no globals).
+        """
+        names: dict[str, Any] = {}
+        lines = []
+        for i, (kind, func) in enumerate(run):
+            names[f"f{i}"] = func
+            if kind == "map":
+                lines.append(f"        v = f{i}(v)")
+            else:
+                lines.append(f"        if not f{i}(v):")
+                lines.append("            continue")
+        params = "".join(f", f{i}=f{i}" for i in range(len(run)))
+        if as_list:
+            head = [f"def _fused(it{params}):", "    out = []", "    append = out.append"]
+            tail = ["        append(v)", "    return out"]
+        else:
+            head = [f"def _fused(it{params}):"]
+            tail = ["        yield v"]
+        source = "\n".join(head + ["    for v in it:"] + lines + tail) + "\n"
+        exec(compile(source, "<Stream fused stage>", "exec"), names)
+        return names["_fused"]
+
+    def _iterator(self, chunk_size: int | None = None) -> Iterator[Any]:
+        it: Iterator[Any] = iter(self._source)
+        steps = self._steps
+        i = 0
+        while i < len(steps):
+            kind, arg = steps[i]
+            if kind in ("map", "filter"):
+                j = i
+                while j < len(steps) and steps[j][0] in ("map", "filter"):
+                    j += 1
+                if chunk_size:
+                    fused_list = self._fuse(steps[i:j], as_list=True)
+                    batches = iter(lambda it=it: list(islice(it, chunk_size)), [])
+                    it = chain.from_iterable(map(fused_list, batches))
+                else:
+                    it = self._fuse(steps[i:j], as_list=False)(it)
+                i = j
+                continue
+            if kind == "scan":
+                func, initial = arg
+                # accumulate() without a func adds in C; same result as
+                # operator.add without one Python-level call per item.
+                func = None if func is operator.add else func
+                if initial is None:
+                    it = accumulate(it, func)
+                else:
+                    it = islice(accumulate(it, func, initial=initial), 1, None)
+            elif kind == "chunk":
+                it = iter(lambda it=it, size=arg: tuple(islice(it, size)), ())
+            elif kind == "take":
+                it = islice(it, arg)
+            i += 1
+        return it
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._iterator()
+
+    def to_list(self, chunk_size: int | None = None) -> list:
+        """
+        Run the pipeline. With `chunk_size`, fused map/filter runs process
+        lists of that many items at a time instead of one generator step
+        per item (see benchmark_stream() for whether it pays off).
+        """
+        return list(self._iterator(chunk_size))
+
+
+def benchmark_stream(n: int = 1_000_000) -> None:
+    """
+    Per-item overhead of the same pipeline, in the same order, built as:
+
+    - "inlined generators": hand-written generators, no function calls
+      per step (the floor for pure Python);
+    - "stacked map/filter generators": one generator per step calling the
+      same functions as the Stream, i.e. what Stream replaces;
+    - Stream, fused and in chunks.
+
+    The fused Stream should beat the stacked generators (one frame for the
+    whole run instead of one per step), not the inlined ones.
+    """
+
+    def gen_filter(predicate, items):
+        for item in items:
+            if predicate(item):
+                yield item
+
+    def gen_map(func, items):
+        for item in items:
+            yield func(item)
+
+    def positive(numbers):
+        for number in numbers:
+            if number > 0:
+                yield number
+
+    def squares(numbers):
+        for number in numbers:
+            yield number * number
+
+    def running_total(numbers):
+        total = 0
+        for number in numbers:
+            total += number
+            yield total
+
+    def timed(label: str, run: Callable[[], Any], repeat: int = 3) -> Any:
+        best = float("inf")
+        for _ in range(repeat):  # best of `repeat`: less scheduler noise
+            start = time.perf_counter()
+            result = run()
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:38} {best / n * 1e9:8.1f} ns/item")
+        return result
+
+    is_positive, square = (lambda x: x > 0), (lambda x: x * x)
+    numbers = range(-n // 2, n // 2)
+    expected = timed(
+        "numbers: inlined generators", lambda: list(running_total(squares(positive(numbers))))
+    )
+    stacked = timed(
+        "numbers: stacked map/filter generators",
+        lambda: list(accumulate(gen_map(square, gen_filter(is_positive, numbers)))),
+    )
+    numeric = Stream(numbers).filter(is_positive).map(square).scan(operator.add)
+    fused = timed("numbers: Stream (fused)", numeric.to_list)
+    chunked = timed("numbers: Stream (chunks of 4096)", lambda: numeric.to_list(chunk_size=4096))
+    assert expected == stacked == fused == chunked
+
+    # Same order on every side: tag every id, then parse the tag back and
+    # keep those ending in 1 (what tag_student_ids -> filter_ids_by_last_digit do).
+    ids = range(250_000, 250_000 + n)
+    tag = "UPBC-{}".format
+
+    def ends_in_one(tagged: str) -> bool:
+        return int(tagged.split("-")[1]) % 10 == 1
+
+    expected = timed(
+        "ids: Rank 5 generators",
+        lambda: list(filter_ids_by_last_digit(tag_student_ids(ids, "UPBC-"), 1)),
+    )
+    stacked = timed(
+        "ids: stacked map/filter generators",
+        lambda: list(gen_filter(ends_in_one, gen_map(tag, ids))),
+    )
+    tagged = Stream(ids).map(tag).filter(ends_in_one)
+    fused = timed("ids: Stream (fused)", tagged.to_list)
+    chunked = timed("ids: Stream (chunks of 4096)", lambda: tagged.to_list(chunk_size=4096))
+    assert expected == stacked == fused == chunked
+
+
 # ===========================================================
 # Demo / manual testing
 # ===========================================================
@@ -196,3 +413,8 @@ if __name__ == "__main__":
     filtered = list(filter_ids_by_last_digit(tagged, 1))
     print("Filtered IDs (last digit = 1):", filtered)
     print("-" * 40)
+
+    print("== Rank 5+ ==")
+    fused = Stream(ids).map(lambda sid: f"UPBC-{sid}").filter(lambda t: t.endswith("1"))
+    print("Stream-filtered IDs:", fused.to_list())
+    print("-" * 40)
@@ -263,3 +263,148 @@ for group in chunk_iterable(levels, chunk_size=4):
     print("Group:", list(group))
 
 print("-" * 50)
+
+
+# ===========================================================
+# Rank 5+ — Performance
+# Allocation-light chunking for iterators, sequences and buffers
+# ===========================================================
+
+import time
+from array import array
+from itertools import islice
+
+
+# Types whose slices are cheap C-level copies of the same type. Other
+# Sequences (deque, user classes) may not support slicing at all.
+_SLICEABLE = (list, tuple, str, range, array)
+
+
+def chunked(
+    iterable,
+    chunk_size: int,
+    *,
+    pad: bool = False,
+    fillvalue=None,
+    strict: bool = False,
+    reuse_buffer: bool = False,
+):
+    """
+    Faster, more flexible chunk_iterable().
+
+    Paths:
+    - bytes / bytearray -> zero-copy memoryview slices of the bytes.
+    - memoryview -> zero-copy slices in the view's own format, so a view
+      of array('i') is chunked in ints, not bytes (1-D views only).
+    - list, tuple, str, range, array -> seq[i:i + n] slices: one C-level
+      copy per chunk, no per-item next()/append().
+    - any other iterable (including Sequences that cannot be sliced, such
+      as deque) -> list(islice(it, n)) per chunk.
+
+    Options:
+    - pad=True: fill the last chunk up to chunk_size with `fillvalue`.
+      The padded chunk keeps the type of the other chunks: list, tuple,
+      array, str (fillvalue must be a 1-character str) and memoryview
+      (fillvalue None means 0). Other sequences, e.g. range, get a list.
+    - strict=True: raise ValueError if the last chunk is incomplete.
+    - reuse_buffer=True (iterator path only): yield the SAME list object
+      every time, refilled in place. Only for consumers that do not keep
+      chunks around (e.g. sum(chunk), writing chunk to a file).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if isinstance(iterable, memoryview):
+        if iterable.ndim != 1:
+            raise ValueError("chunked() supports 1-dimensional memoryviews only")
+        yield from _chunk_sequence(iterable, chunk_size, pad, fillvalue, strict)
+    elif isinstance(iterable, (bytes, bytearray)):
+        yield from _chunk_sequence(memoryview(iterable), chunk_size, pad, fillvalue, strict)
+    elif isinstance(iterable, _SLICEABLE):
+        yield from _chunk_sequence(iterable, chunk_size, pad, fillvalue, strict)
+    else:
+        yield from _chunk_iterator(iter(iterable), chunk_size, pad, fillvalue, strict, reuse_buffer)
+
+
+def _chunk_sequence(seq, chunk_size: int, pad: bool, fillvalue, strict: bool):
+    length = len(seq)
+    full_end = length - length % chunk_size
+    for start in range(0, full_end, chunk_size):
+        yield seq[start:start + chunk_size]
+    if full_end == length:
+        return
+    last = seq[full_end:]
+    if strict:
+        raise ValueError(f"last chunk has {len(last)} items, expected {chunk_size}")
+    if pad:
+        # Padding needs new storage, so only the last chunk is copied.
+        last = _pad_chunk(last, chunk_size, fillvalue)
+    yield last
+
+
+def _pad_chunk(last, chunk_size: int, fillvalue):
+    missing = chunk_size - len(last)
+    if isinstance(last, memoryview):
+        padded = memoryview(bytearray(chunk_size * last.itemsize)).cast(last.format)
+        padded[:len(last)] = last
+        if fillvalue is not None:
+            for i in range(len(last), chunk_size):
+                padded[i] = fillvalue
+        return padded
+    if isinstance(last, str):
+        if not (isinstance(fillvalue, str) and len(fillvalue) == 1):
+            raise TypeError("padding a str needs a 1-character str fillvalue")
+        return last + fillvalue * missing
+    if type(last) in (list, tuple):
+        return last + type(last)((fillvalue,)) * missing
+    if isinstance(last, array):
+        return last + array(last.typecode, [fillvalue]) * missing
+    return list(last) + [fillvalue] * missing
+
+
+def _chunk_iterator(iterator, chunk_size: int, pad: bool, fillvalue, strict: bool, reuse_buffer: bool):
+    buffer: list = []
+    while True:
+        if reuse_buffer:
+            buffer[:] = islice(iterator, chunk_size)
+            chunk = buffer
+        else:
+            chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        if len(chunk) < chunk_size:
+            if strict:
+                raise ValueError(f"last chunk has {len(chunk)} items, expected {chunk_size}")
+            if pad:
+                chunk.extend([fillvalue] * (chunk_size - len(chunk)))
+            yield chunk
+            return
+        yield chunk
+
+
+def benchmark_chunking(n: int = 10_000_000, chunk_size: int = 1000) -> None:
+    """
+    Compare chunk_iterable() with the chunked() paths on n items.
+    Each run just sums the chunk lengths, so chunking is all that's measured.
+    """
+    items = list(range(n))
+    buffer = bytes(n)
+
+    runs = [
+        ("chunk_iterable(iterator)", lambda: chunk_iterable(iter(items), chunk_size)),
+        ("chunked(iterator)", lambda: chunked(iter(items), chunk_size)),
+        ("chunked(iterator, reuse_buffer)", lambda: chunked(iter(items), chunk_size, reuse_buffer=True)),
+        ("chunked(list) -> slices", lambda: chunked(items, chunk_size)),
+        ("chunked(bytes) -> memoryviews", lambda: chunked(buffer, chunk_size)),
+    ]
+    for label, make_chunks in runs:
+        start = time.perf_counter()
+        total = sum(len(chunk) for chunk in make_chunks())
+        elapsed = time.perf_counter() - start
+        print(f"{label:34} {elapsed:7.3f} s  ({total:,} items)")
+
+
+print("\nRank 5+ — chunked():")
+print("Padded groups:", [list(group) for group in chunked(range(1, 11), 4, pad=True, fillvalue=0)])
+print("Zero-copy views:", [bytes(view) for view in chunked(b"WorldOfWarcraft", 5)])
+print("-" * 50)
@@ -23,8 +23,8 @@ ID Number: 250161
 Year: 2025
 """
 
-from collections import namedtuple
-from typing import NamedTuple, List
+from collections import defaultdict, namedtuple
+from typing import Dict, NamedTuple, List
 
 
 # ===========================================================
@@ -201,6 +201,20 @@ def find_lessons_by_teacher(
     return [lesson for lesson in lessons if lesson.teacher == teacher_name]
 
 
+def index_lessons_by(lessons: List[Lesson], field_name: str) -> Dict[str, List[Lesson]]:
+    """
+    Group lessons by one field ("teacher", "room", "subject") in one pass.
+
+    Build it once, then each lookup is a dict access instead of the full
+    scan find_lessons_by_teacher() does per call. For time-based queries
+    and double-booking checks see TimetableIndex in Module 28.
+    """
+    index: Dict[str, List[Lesson]] = defaultdict(list)
+    for lesson in lessons:
+        index[getattr(lesson, field_name)].append(lesson)
+    return dict(index)
+
+
 timetable = build_daily_timetable()
 print_timetable(timetable)
 
@@ -209,4 +223,8 @@ print("\nLessons taught by Prof. Peyman:")
 for lesson in pey_man_lessons:
     print(f"- {lesson.subject} in room {lesson.room} ({lesson.start_time})")
 
+lessons_by_teacher = index_lessons_by(timetable, "teacher")
+assert lessons_by_teacher["Prof. Peyman"] == pey_man_lessons
+print("Teachers (indexed):", sorted(lessons_by_teacher))
+
 print("-" * 50)
@@ -21,8 +21,14 @@ ID Number: 250161
 Year: 2025
 """
 
+import time
 from functools import partial
-from typing import Callable, Any, Dict, List
+from typing import Callable, Any, Dict, Iterable, List, Sequence
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # NumPy is optional; apply_many falls back to map()
+    np = None
 
 # ===========================================================
 # Rank 1 — Beginner
@@ -170,10 +176,12 @@ def build_price_pipeline() -> List[Callable[[Any], Any]]:
     3. Format with currency symbol.
     """
     # Note: pipeline functions must each accept and return a single value.
+    # The partials are returned directly (no lambda wrappers), so
+    # compose_pipeline() can look inside them and inline their arguments.
     return [
-        lambda price: apply_mx_tax(price),
-        lambda price: apply_student_discount(price),
-        lambda price: format_mx_price(price),
+        apply_mx_tax,
+        apply_student_discount,
+        format_mx_price,
     ]
 
 
@@ -199,3 +207,196 @@ for original, final in zip(original_prices, final_prices):
     print(f"  Original: {original:7.2f}  ->  Final: {final}")
 
 print("-" * 50)
+
+
+# ===========================================================
+# Rank 5+ — Performance
+# Compiled pipelines: flatten partials, fuse the chain into one call
+# ===========================================================
+
+print("Rank 5+ — Performance")
+
+
+def vectorizable(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Mark a stage as purely numeric, so apply_many() may run it once over a
+    whole NumPy array instead of once per value.
+
+    Only mark stages that use plain arithmetic on their input
+    (apply_tax, apply_discount, ...), never formatting or branching.
+
+    Returns a new no-arg partial carrying the mark; `func` itself (often a
+    shared module-level partial such as apply_mx_tax) is left untouched.
+    """
+    marked = partial(func)
+    marked._vectorizable = True
+    return marked
+
+
+def _flatten_partial(func: Callable[..., Any]):
+    """
+    Unwrap nested partials into (target, args, keywords).
+
+    partial(partial(f, a), b, k=1) -> (f, (a, b), {"k": 1})
+    Outer keywords override inner ones, exactly as partial() itself does.
+    """
+    args: tuple = ()
+    keywords: Dict[str, Any] = {}
+    while isinstance(func, partial):
+        args = func.args + args
+        keywords = {**func.keywords, **keywords}
+        func = func.func
+    return func, args, keywords
+
+
+class CompiledPipeline:
+    """
+    A chain of one-argument stages compiled into a single Python function.
+
+    compose_pipeline(f, g, h)(x) == h(g(f(x))), but instead of looping over
+    the stages the constructor generates
+
+        def _fused(x):
+            return h_target(h_args..., g_target(f_target(x, k=v), ...), ...)
+
+    so each value costs one Python call frame plus one direct call per
+    stage target, with no partial() dispatch and no per-stage loop.
+    """
+
+    def __init__(self, stages: Sequence[Callable[[Any], Any]]):
+        self.stages: List[Callable[[Any], Any]] = list(stages)
+        self._fused = self._compile(self.stages)
+        # One compiled function per stage, for the stage-wise apply_many().
+        self._stage_calls = [self._compile([stage]) for stage in self.stages]
+
+    @staticmethod
+    def _compile(stages: Sequence[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+        if not stages:
+            return lambda value: value
+
+        namespace: Dict[str, Any] = {}
+        expr = "x"
+        for i, stage in enumerate(stages):
+            target, args, keywords = _flatten_partial(stage)
+            namespace[f"f{i}"] = target
+            parts = []
+            for j, arg in enumerate(args):
+                namespace[f"a{i}_{j}"] = arg
+                parts.append(f"a{i}_{j}")
+            parts.append(expr)
+            for key, value in keywords.items():
+                namespace[f"k{i}_{key}"] = value
+                parts.append(f"{key}=k{i}_{key}")
+            expr = f"f{i}({', '.join(parts)})"
+
+        source = f"def _fused(x):\n    return {expr}\n"
+        exec(compile(source, "<compiled pipeline>", "exec"), namespace)
+        return namespace["_fused"]
+
+    def __call__(self, value: Any) -> Any:
+        return self._fused(value)
+
+    def apply_many(self, values: Iterable[Any], use_numpy: bool = True) -> List[Any]:
+        """
+        Batched mode: run each stage across the whole list before moving on.
+
+        Leading stages marked with vectorizable() run as a single NumPy
+        expression when NumPy is installed; the rest run through the
+        C-level map() loop, one stage at a time.
+        """
+        values = list(values)
+        stages = self.stages
+        start = 0
+
+        if use_numpy and np is not None and values:
+            while start < len(stages) and getattr(stages[start], "_vectorizable", False):
+                start += 1
+            if start:
+                column = np.asarray(values, dtype=np.float64)
+                for stage in stages[:start]:
+                    column = stage(column)
+                values = column.tolist()
+
+        for call in self._stage_calls[start:]:
+            values = list(map(call, values))
+        return values
+
+    def __repr__(self) -> str:
+        names = [getattr(_flatten_partial(s)[0], "__name__", repr(s)) for s in self.stages]
+        return f"CompiledPipeline({' -> '.join(names)})"
+
+
+def compose_pipeline(*funcs: Callable[[Any], Any]) -> CompiledPipeline:
+    """
+    Build a CompiledPipeline from stages, flattening nested pipelines.
+
+    compose_pipeline(compose_pipeline(f, g), h) has the same three stages
+    as compose_pipeline(f, g, h), so nesting never adds call overhead.
+    """
+    stages: List[Callable[[Any], Any]] = []
+    for func in funcs:
+        if isinstance(func, CompiledPipeline):
+            stages.extend(func.stages)
+        else:
+            stages.append(func)
+    return CompiledPipeline(stages)
+
+
+def build_price_pipeline_compiled() -> CompiledPipeline:
+    """
+    The Rank 5 price pipeline, compiled. Tax and discount are plain
+    arithmetic, so they are marked vectorizable for apply_many().
+    """
+    tax, discount, fmt = build_price_pipeline()
+    return compose_pipeline(vectorizable(tax), vectorizable(discount), fmt)
+
+
+def process_prices_compiled(prices: List[float]) -> List[str]:
+    """Same output as process_prices(), computed stage-by-stage in batch."""
+    return build_price_pipeline_compiled().apply_many(prices)
+
+
+def benchmark_price_pipeline(n: int = 10_000_000) -> Dict[str, float]:
+    """
+    Time the per-value loop against the fused callable and apply_many()
+    on n prices. Returns seconds per strategy.
+
+    10M formatted strings need a few GB of RAM; pass a smaller n on
+    constrained machines.
+    """
+    prices = [float(i % 1000) + 0.99 for i in range(n)]
+    compiled = build_price_pipeline_compiled()
+
+    strategies = {
+        "naive loop": lambda: process_prices(prices),
+        "fused callable": lambda: list(map(compiled, prices)),
+        "apply_many (map)": lambda: compiled.apply_many(prices, use_numpy=False),
+    }
+    if np is not None:
+        strategies["apply_many (numpy)"] = lambda: compiled.apply_many(prices)
+
+    timings: Dict[str, float] = {}
+    reference = None
+    for name, run in strategies.items():
+        start = time.perf_counter()
+        output = run()
+        timings[name] = time.perf_counter() - start
+        if reference is None:
+            reference = output[:1000]
+        assert output[:1000] == reference, f"{name} disagrees with the naive loop"
+        del output
+        print(f"  {name:<20} {timings[name]:8.3f}s")
+    return timings
+
+
+mx_pipeline = build_price_pipeline_compiled()
+print(mx_pipeline)
+print("Single value:", mx_pipeline(100.0))
+print("Batch:", process_prices_compiled(original_prices))
+assert process_prices_compiled(original_prices) == final_prices
+print("Nested partials flattened:", _flatten_partial(partial(partial(apply_tax), tax_rate=0.08)))
+
+if __name__ == "__main__":
+    benchmark_price_pipeline(n=200_000)
+
+print("-" * 50)
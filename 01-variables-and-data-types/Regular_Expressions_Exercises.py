@@ -22,8 +22,12 @@ ID Number: 250161
 Year: 2025
 """
 
+import operator
+import random
 import re
-from typing import List
+import time
+from itertools import repeat
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Union
 
 
 # ===========================================================
@@ -147,8 +151,11 @@ def is_valid_ipv4(ip: str) -> bool:
     return bool(IPV4_RE.match(ip))
 
 
+HASHTAG_RE = re.compile(r"#(\w+)")
+
+
 def extract_hashtags(text: str) -> List[str]:
-    return re.findall(r"#(\w+)", text)
+    return HASHTAG_RE.findall(text)
 
 
 test_usernames = ["pey", "peyman_250161", "x", "invalid-username!!!"]
@@ -167,3 +174,259 @@ print("\nHashtags extracted from tweet:")
 print(extract_hashtags(tweet))
 
 print("-" * 50)
+
+
+# ===========================================================
+# Rank 5+ — Performance
+# Precompiled pattern set, batch validation, IPv4 fast path
+# ===========================================================
+
+print("Rank 5+ — Performance")
+
+# Same rules as is_valid_password (Module 36 solutions) and
+# is_valid_email (Module 36 examples), compiled once here.
+PASSWORD_RE = re.compile(r"^(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d]{8,}$")
+EMAIL_RE = re.compile(r"\w+@\w+\.\w+")
+
+
+IPV4_OCTETS = frozenset(str(i) for i in range(256))
+
+
+def is_valid_ipv4_fast(ip: str) -> bool:
+    """
+    IPV4_RE without the regex engine: split on "." and look each octet up
+    in the set of the 256 valid spellings ("0".."255", no leading zeros).
+
+    Same answers as is_valid_ipv4(). The only inputs the set cannot judge
+    are the ones the regex accepts through its looser corners (a trailing
+    newline allowed by `$`, non-ASCII digits matched by \\d); those rare
+    inputs are handed to IPV4_RE.
+    """
+    parts = ip.split(".")
+    if (
+        len(parts) == 4
+        and parts[0] in IPV4_OCTETS
+        and parts[1] in IPV4_OCTETS
+        and parts[2] in IPV4_OCTETS
+        and parts[3] in IPV4_OCTETS
+    ):
+        return True
+    if ip.isascii() and not ip.endswith("\n"):
+        return False
+    return IPV4_RE.match(ip) is not None
+
+
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+_NUMBERED_REFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+def _scoped_pattern(compiled: Pattern[str]) -> str:
+    """
+    compiled.pattern wrapped in a group carrying compiled.flags, so it
+    behaves the same inside an alternation: re.compile("abc", re.I)
+    becomes "(?i:abc)".
+    """
+    letters = "".join(letter for flag, letter in _INLINE_FLAGS if compiled.flags & flag)
+    if not letters:
+        return f"(?:{compiled.pattern})"
+    # In verbose mode a trailing "# comment" would swallow the ")".
+    end = "\n)" if "x" in letters else ")"
+    return f"(?{letters}:{compiled.pattern}{end}"
+
+
+class PatternSet:
+    """
+    Named, precompiled validators.
+
+    Each pattern is compiled once in add(). Per pattern we keep the bound
+    matcher (pattern.match or pattern.fullmatch, matching how the original
+    helper called it), so validating never goes through re's cache lookup.
+
+    - validate_many(): one pattern over a batch, looping in C via map().
+    - first_match(): every pattern at once through one combined
+      alternation (?P<name>...)|(?P<name>...); returns the first name
+      that matches, in registration order. Patterns that cannot share
+      one regex are checked one by one instead, with the same answer.
+    - findall_many(): extraction (hashtags) over many texts.
+    """
+
+    def __init__(self, flags: int = 0) -> None:
+        self.flags = flags
+        self.patterns: Dict[str, Pattern[str]] = {}
+        self._matchers: Dict[str, Callable[[str], Optional[re.Match]]] = {}
+        self._fast_paths: Dict[str, Callable[[str], bool]] = {}
+        self._anchored: Dict[str, str] = {}
+        self._combined: Union[Pattern[str], None, bool] = None  # False: not combinable
+
+    def add(
+        self,
+        name: str,
+        pattern: Union[str, Pattern[str]],
+        fullmatch: bool = True,
+        fast_path: Optional[Callable[[str], bool]] = None,
+    ) -> "PatternSet":
+        compiled = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, self.flags)
+        self.patterns[name] = compiled
+        self._matchers[name] = compiled.fullmatch if fullmatch else compiled.match
+        if fast_path is not None:
+            self._fast_paths[name] = fast_path
+        # For the combined alternation: the pattern's own flags become scoped
+        # inline flags, and fullmatch becomes an explicit \Z.
+        scoped = _scoped_pattern(compiled)
+        self._anchored[name] = scoped + "\\Z" if fullmatch else scoped
+        self._combined = None
+        return self
+
+    def validate(self, name: str, value: str) -> bool:
+        fast = self._fast_paths.get(name)
+        if fast is not None:
+            return fast(value)
+        return self._matchers[name](value) is not None
+
+    def validate_many(self, name: str, values: Iterable[str], use_fast_path: bool = True) -> List[bool]:
+        """One bool per value, for a single named pattern."""
+        fast = self._fast_paths.get(name) if use_fast_path else None
+        if fast is not None:
+            return list(map(fast, values))
+        return list(map(operator.is_not, map(self._matchers[name], values), repeat(None)))
+
+    def _combined_pattern(self) -> Optional[Pattern[str]]:
+        """
+        The alternation of every pattern, or None when the patterns cannot
+        be combined safely (clashing group names, numbered backreferences
+        that would shift, global inline flags inside a pattern...).
+        """
+        if self._combined is None:
+            texts = [self.patterns[name].pattern for name in self._anchored]
+            if any(_NUMBERED_REFERENCE.search(text) for text in texts):
+                self._combined = False
+            else:
+                alternatives = "|".join(
+                    f"(?P<{name}>{pattern})" for name, pattern in self._anchored.items()
+                )
+                try:
+                    self._combined = re.compile(alternatives)
+                except re.error:
+                    self._combined = False
+        return self._combined or None
+
+    def _first_match_one_by_one(self, value: str) -> Optional[str]:
+        for name, matcher in self._matchers.items():
+            if matcher(value) is not None:
+                return name
+        return None
+
+    def first_match(self, value: str) -> Optional[str]:
+        """Name of the first pattern matching value, or None (one regex call)."""
+        combined = self._combined_pattern()
+        if combined is None:
+            return self._first_match_one_by_one(value)
+        match = combined.match(value)
+        return match.lastgroup if match else None
+
+    def first_match_many(self, values: Iterable[str]) -> List[Optional[str]]:
+        combined = self._combined_pattern()
+        if combined is None:
+            return list(map(self._first_match_one_by_one, values))
+        return [m.lastgroup if m else None for m in map(combined.match, values)]
+
+    def findall_many(self, name: str, texts: Iterable[str]) -> List[List[str]]:
+        """
+        findall() for every text, with the compiled pattern's bound method.
+
+        (Joining the texts and scanning once, then mapping matches back by
+        offset, measured slower for tweet-sized texts: findall() already
+        loops in C, and the per-match bookkeeping runs in Python.)
+        """
+        return list(map(self.patterns[name].findall, texts))
+
+
+def build_validation_patterns() -> PatternSet:
+    """The module's validators as one PatternSet."""
+    return (
+        PatternSet()
+        .add("username", USERNAME_RE, fullmatch=False)
+        # is_valid_ipv4_fast is exact but measured slower than the compiled
+        # IPV4_RE on CPython (see benchmark_validation), so it is not
+        # registered as the default fast path.
+        .add("ipv4", IPV4_RE, fullmatch=False)
+        .add("password", PASSWORD_RE)
+        .add("email", EMAIL_RE)
+        .add("hashtag", HASHTAG_RE)
+    )
+
+
+def benchmark_validation(n: int = 1_000_000) -> Dict[str, float]:
+    """
+    Per-call helpers vs PatternSet batch calls over n mixed inputs.
+    Returns seconds per strategy.
+    """
+    rng = random.Random(3)
+    samples = [
+        "peyman_250161", "x", "invalid-username!!!", "192.168.0.1", "999.1.1.1",
+        "10.0.0.05", "Pass1234", "password", "user@test.com", "invalid-email",
+    ]
+    values = [rng.choice(samples) + ("" if i % 3 else str(i % 250)) for i in range(n)]
+    ips = [f"{rng.randrange(300)}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}"
+           for _ in range(n)]
+    tweets = [f"Learning #Python{i % 100} in #2025 is awesome! #coding" for i in range(n // 10)]
+    patterns = build_validation_patterns()
+    timings: Dict[str, float] = {}
+
+    def timed(label: str, func: Callable[[], object]) -> object:
+        start = time.perf_counter()
+        result = func()
+        timings[label] = time.perf_counter() - start
+        return result
+
+    def email_per_call(email: str) -> bool:
+        # How Module 36 calls it: pattern string re-looked-up every time.
+        return re.fullmatch(r"\w+@\w+\.\w+", email) is not None
+
+    a = timed("username per call", lambda: [is_valid_username(v) for v in values])
+    b = timed("username batch", lambda: patterns.validate_many("username", values))
+    assert a == b
+    a = timed("email per call", lambda: [email_per_call(v) for v in values])
+    b = timed("email batch", lambda: patterns.validate_many("email", values))
+    assert a == b
+    a = timed("ipv4 regex per call", lambda: [is_valid_ipv4(ip) for ip in ips])
+    b = timed("ipv4 regex batch", lambda: patterns.validate_many("ipv4", ips))
+    c = timed("ipv4 octet-set batch", lambda: list(map(is_valid_ipv4_fast, ips)))
+    assert a == b == c
+    names = list(patterns.patterns)
+
+    def classify_per_pattern(value: str) -> Optional[str]:
+        for name in names:
+            if patterns._matchers[name](value) is not None:
+                return name
+        return None
+
+    a = timed("classify per pattern", lambda: [classify_per_pattern(v) for v in values])
+    b = timed("classify combined", lambda: patterns.first_match_many(values))
+    assert a == b
+    a = timed("hashtags per text", lambda: [extract_hashtags(t) for t in tweets])
+    b = timed("hashtags batch", lambda: patterns.findall_many("hashtag", tweets))
+    assert a == b
+
+    for label, seconds in timings.items():
+        print(f"  {label:<22} {seconds:7.3f}s")
+    return timings
+
+
+validation_patterns = build_validation_patterns()
+print("Usernames:", validation_patterns.validate_many("username", test_usernames))
+print("IPs:", validation_patterns.validate_many("ipv4", test_ips))
+print("IPs (octet set):", [is_valid_ipv4_fast(ip) for ip in test_ips])
+print("Classify:", validation_patterns.first_match_many(["pey", "10.0.0.5", "user@test.com", "??"]))
+print("Hashtags:", validation_patterns.findall_many("hashtag", [tweet, "no tags", "#one"]))
+
+if __name__ == "__main__":
+    benchmark_validation(n=200_000)
+
+print("-" * 50)
@@ -196,3 +196,184 @@ print("Previous window:", manager.prev())
 print("Jump to index 25:", manager.goto(25))
 
 print("-" * 50)
+
+
+# ===========================================================
+# Rank 5+ — Performance
+# Overlapping windows, zero-copy views, O(1) aggregates
+# ===========================================================
+
+print("Rank 5+ — Performance")
+
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
+
+
+class SequenceView(Sequence):
+    """
+    Read-only window into a list (or any sequence) WITHOUT copying it.
+    Lists have no built-in views, so this just remembers (data, start, stop).
+    """
+
+    def __init__(self, data: Sequence, start: int, stop: int) -> None:
+        self.data = data
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self.data[self.start + start:self.start + stop:step]
+            return SequenceView(self.data, self.start + start, self.start + max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SequenceView index out of range")
+        return self.data[self.start + index]
+
+    def __iter__(self):
+        return islice(self.data, self.start, self.stop)
+
+    def __repr__(self) -> str:
+        return f"SequenceView({list(self)!r})"
+
+
+class SlidingWindowManager(WindowManager):
+    """
+    WindowManager for time series:
+
+    - `step` can be smaller than `window_size` (overlapping windows).
+    - current()/next()/prev()/goto() return zero-copy views: memoryview
+      slices for array/bytes/memoryview data, SequenceView for lists.
+    - sum/mean/min/max are kept up to date incrementally: sliding forward
+      by `step` costs O(step) (amortized), using a running total and two
+      monotonic deques for min/max. Scanning a whole series with
+      iter_aggregates() is O(n) in total.
+    - Moving backwards or jumping with goto() recomputes once, O(window).
+    """
+
+    def __init__(self, data, window_size: int, step: int | None = None) -> None:
+        super().__init__(data, window_size)
+        self.step = window_size if step is None else step
+        if self.step < 1:
+            raise ValueError("step must be at least 1")
+        try:
+            memoryview(data)  # array, bytes, bytearray, memoryview, mmap...
+            self._use_memoryview = True
+        except TypeError:
+            self._use_memoryview = False
+        self._lo = self._hi = 0
+        self._total = 0
+        self._min_idx: deque = deque()  # indices, values increasing
+        self._max_idx: deque = deque()  # indices, values decreasing
+        self._slide_to(0, min(window_size, len(data)))
+
+    # --- incremental aggregates ------------------------------------------
+
+    def _push(self, index: int) -> None:
+        value = self.data[index]
+        self._total += value
+        while self._min_idx and self.data[self._min_idx[-1]] >= value:
+            self._min_idx.pop()
+        self._min_idx.append(index)
+        while self._max_idx and self.data[self._max_idx[-1]] <= value:
+            self._max_idx.pop()
+        self._max_idx.append(index)
+
+    def _slide_to(self, lo: int, hi: int) -> None:
+        if lo < self._lo or hi < self._hi or lo > self._hi:
+            # Backwards or a jump past the current window: start over.
+            self._total = 0
+            self._min_idx.clear()
+            self._max_idx.clear()
+            self._lo = self._hi = lo
+        for index in range(self._hi, hi):
+            self._push(index)
+        for index in range(self._lo, lo):
+            self._total -= self.data[index]
+        while self._min_idx and self._min_idx[0] < lo:
+            self._min_idx.popleft()
+        while self._max_idx and self._max_idx[0] < lo:
+            self._max_idx.popleft()
+        self._lo, self._hi = lo, hi
+
+    def _sync(self) -> None:
+        self._slide_to(self.position, min(self.position + self.window_size, len(self.data)))
+
+    @property
+    def sum(self):
+        self._sync()
+        return self._total
+
+    @property
+    def mean(self) -> float | None:
+        self._sync()
+        size = self._hi - self._lo
+        return self._total / size if size else None
+
+    @property
+    def min(self):
+        self._sync()
+        return self.data[self._min_idx[0]] if self._min_idx else None
+
+    @property
+    def max(self):
+        self._sync()
+        return self.data[self._max_idx[0]] if self._max_idx else None
+
+    def aggregates(self) -> dict:
+        return {"sum": self.sum, "mean": self.mean, "min": self.min, "max": self.max}
+
+    # --- movement (same rules as WindowManager, but by `step`) ------------
+
+    def current(self):
+        stop = min(self.position + self.window_size, len(self.data))
+        if self._use_memoryview:
+            return memoryview(self.data)[self.position:stop]
+        return SequenceView(self.data, self.position, stop)
+
+    def next(self):
+        if self.position + self.step < len(self.data):
+            self.position += self.step
+        return self.current()
+
+    def prev(self):
+        if self.position - self.step >= 0:
+            self.position -= self.step
+        return self.current()
+
+    def iter_aggregates(self):
+        """Yield (position, aggregates) for every window from the start, in O(n)."""
+        self.position = 0
+        while True:
+            yield self.position, self.aggregates()
+            if self.position + self.window_size >= len(self.data):
+                return
+            position = self.position
+            self.next()
+            if self.position == position:  # step > window_size: no window left
+                return
+
+    def __repr__(self) -> str:
+        return (
+            f"SlidingWindowManager(size={self.window_size}, step={self.step}, "
+            f"position={self.position})"
+        )
+
+
+from array import array
+
+readings = array("d", [3, 1, 4, 1, 5, 9, 2, 6, 5, 3])
+sliding = SlidingWindowManager(readings, window_size=4, step=2)
+
+print("First window (memoryview):", sliding.current().tolist(), sliding.aggregates())
+print("Next window:", sliding.next().tolist(), sliding.aggregates())
+for position, stats in SlidingWindowManager(data_list, 10, step=5).iter_aggregates():
+    print(f"Window at {position:2}: {stats}")
+
+print("-" * 50)
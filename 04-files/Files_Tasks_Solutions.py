@@ -18,6 +18,12 @@ In `Files_Tasks.py` I should first try to solve each task on my own, then come
 here to compare style, structure, and best practices.
 """
 
+import mmap
+import multiprocessing
+import os
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
@@ -329,6 +335,545 @@ def read_config_key(path: str, key: str, default: str | None = None) -> str | No
     return default
 
 
+# ============================================================
+# Rank 5+ — Performance
+# The same file tasks, rewritten so they keep working on very
+# large files (millions of lines, many GB).
+# ============================================================
+
+CHUNK_SIZE = 1024 * 1024  # 1 MiB per binary read
+
+
+def _count_newlines(f, start: int = 0) -> tuple[int, int, bytes]:
+    """
+    Helper:
+    - Count b"\\n" bytes from offset `start` to EOF of a binary file `f`.
+    - Reads fixed-size chunks, so memory stays constant.
+
+    Returns:
+        (newline_count, end_offset, last_byte)
+        `last_byte` is b"" when nothing was read.
+    """
+    f.seek(start)
+    count = 0
+    offset = start
+    last_byte = b""
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        count += chunk.count(b"\n")
+        offset += len(chunk)
+        last_byte = chunk[-1:]
+    return count, offset, last_byte
+
+
+def _log_index_path(log_file: str) -> Path:
+    """Sidecar file that stores "<line_count> <byte_offset>" for `log_file`."""
+    return Path(f"{log_file}.idx")
+
+
+def _read_log_index(log_file: str) -> tuple[int, int]:
+    """
+    Helper:
+    - Return (line_count, byte_offset) from the sidecar index.
+    - A missing or broken sidecar counts as (0, 0) (= "rescan everything").
+    """
+    try:
+        count_text, offset_text = _log_index_path(log_file).read_text(
+            encoding="utf-8"
+        ).split()
+        return int(count_text), int(offset_text)
+    except (FileNotFoundError, ValueError):
+        return 0, 0
+
+
+def _write_log_index(log_file: str, line_count: int, offset: int) -> None:
+    """
+    Helper:
+    - Save the sidecar atomically (write a temp file, then `os.replace`).
+    - A crash can never leave a half-written index behind.
+    """
+    index_path = _log_index_path(log_file)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.write_text(f"{line_count} {offset}\n", encoding="utf-8")
+    os.replace(tmp_path, index_path)
+
+
+def load_log_index(log_file: str) -> tuple[int, int]:
+    """
+    Task (Rank 5+):
+    - Return the current (line_count, byte_offset) of `log_file`.
+    - Trust the sidecar index, but repair it if the log changed behind its back:
+        - log grew (crash after writing the log, before the index):
+          scan ONLY the bytes after the last known offset.
+        - log shrank or was replaced: rescan from the start.
+
+    Notes:
+    - A final line without "\\n" (torn write) still counts as a line,
+      just like `for line in f` does in `append_log_message`.
+    """
+    path = Path(log_file)
+    if not path.exists():
+        return 0, 0
+
+    line_count, offset = _read_log_index(log_file)
+    size = path.stat().st_size
+    if size == offset:
+        return line_count, offset
+
+    if size < offset:
+        line_count, offset = 0, 0
+
+    with path.open("rb") as f:
+        # A partial last line was already counted; don't count its "\n" twice.
+        if offset > 0:
+            f.seek(offset - 1)
+            if f.read(1) != b"\n":
+                line_count -= 1
+        new_lines, offset, last_byte = _count_newlines(f, offset)
+
+    line_count += new_lines
+    if last_byte and last_byte != b"\n":
+        line_count += 1
+
+    _write_log_index(log_file, line_count, offset)
+    return line_count, offset
+
+
+def append_log_messages(log_file: str, messages: list[str]) -> int:
+    """
+    Task (Rank 5+):
+    - Append many log messages in ONE open/write/flush.
+    - Number them like `append_log_message` ("[N] message"), but read the
+      current count from the sidecar index instead of rescanning the log.
+    - A message with embedded "\n" takes several lines, so the next index
+      skips ahead exactly as a rescan in `append_log_message` would.
+
+    Cost:
+    - O(total message length) per call, no matter how large the log already is.
+
+    Returns:
+        The index of the last message written.
+    """
+    line_count, offset = load_log_index(log_file)
+    if not messages:
+        return line_count
+
+    parts: list[str] = []
+    if offset > 0:
+        # Finish a torn last line so the new entry starts on its own line.
+        with open(log_file, "rb") as f:
+            f.seek(offset - 1)
+            if f.read(1) != b"\n":
+                parts.append("\n")
+
+    new_count = line_count
+    for message in messages:
+        last_index = new_count + 1
+        parts.append(f"[{last_index}] {message}\n")
+        new_count += message.count("\n") + 1
+    data = "".join(parts).encode("utf-8")
+
+    with open(log_file, "ab") as f:
+        f.write(data)
+        f.flush()
+
+    _write_log_index(log_file, new_count, offset + len(data))
+    return last_index
+
+
+def append_log_message_indexed(log_file: str, message: str) -> int:
+    """
+    Task (Rank 5+):
+    - Same result as `append_log_message`, but in constant time.
+    - Writing N messages costs O(N) in total instead of O(N²).
+
+    Returns:
+        The index given to `message`.
+    """
+    return append_log_messages(log_file, [message])
+
+
+def _decode_log_line(raw: bytes) -> str:
+    """
+    Helper:
+    - Turn one raw line into the same text `summarize_log_file` would show:
+      trailing "\n" / "\r\n" removed, decoded as UTF-8.
+    """
+    if raw.endswith(b"\n"):
+        raw = raw[:-1]
+    if raw.endswith(b"\r"):
+        raw = raw[:-1]
+    return raw.decode("utf-8", errors="replace")
+
+
+def _read_last_line(f, size: int) -> bytes:
+    """
+    Helper:
+    - Find the last line of a binary file by seeking backwards from EOF.
+    - Only reads the tail of the file, block by block, until it sees the
+      "\n" that ends the previous line.
+    """
+    end = size
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        end -= 1  # ignore the final line terminator
+
+    tail = b""
+    pos = end
+    while pos > 0:
+        step = min(CHUNK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        tail = f.read(step) + tail
+        newline_at = tail.rfind(b"\n")
+        if newline_at != -1:
+            return tail[newline_at + 1:]
+    return tail
+
+
+def summarize_log_file_streaming(log_file: str) -> dict:
+    """
+    Task (Rank 5+):
+    - Same result as `summarize_log_file`, without keeping any lines in memory.
+        - line_count: count b"\n" over fixed-size binary chunks.
+        - first_line: a single `readline()` from the start.
+        - last_line: seek backwards from EOF (see `_read_last_line`).
+
+    Memory:
+    - Constant (one chunk), even for multi-GB logs.
+    """
+    path = Path(log_file)
+    size = path.stat().st_size if path.exists() else 0
+    if size == 0:
+        return {
+            "line_count": 0,
+            "first_line": None,
+            "last_line": None,
+        }
+
+    with path.open("rb") as f:
+        newlines, _, last_byte = _count_newlines(f)
+        line_count = newlines + (1 if last_byte != b"\n" else 0)
+
+        f.seek(0)
+        first_line = f.readline()
+        last_line = _read_last_line(f, size)
+
+    return {
+        "line_count": line_count,
+        "first_line": _decode_log_line(first_line),
+        "last_line": _decode_log_line(last_line),
+    }
+
+
+def summarize_log_file_mmap(log_file: str) -> dict:
+    """
+    Task (Rank 5+):
+    - Same result as `summarize_log_file_streaming`, using `mmap`.
+    - The OS pages the file in on demand; `find`/`rfind` run in C
+      directly on the mapped bytes.
+    """
+    path = Path(log_file)
+    size = path.stat().st_size if path.exists() else 0
+    if size == 0:
+        # mmap cannot map an empty file.
+        return {
+            "line_count": 0,
+            "first_line": None,
+            "last_line": None,
+        }
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        newlines = 0
+        for start in range(0, size, CHUNK_SIZE):
+            newlines += mm[start:start + CHUNK_SIZE].count(b"\n")
+        ends_with_newline = mm[size - 1:size] == b"\n"
+        line_count = newlines + (0 if ends_with_newline else 1)
+
+        first_end = mm.find(b"\n")
+        first_line = mm[:size if first_end == -1 else first_end + 1]
+
+        end = size - 1 if ends_with_newline else size
+        last_start = mm.rfind(b"\n", 0, end) + 1
+        last_line = mm[last_start:end]
+
+    return {
+        "line_count": line_count,
+        "first_line": _decode_log_line(first_line),
+        "last_line": _decode_log_line(last_line),
+    }
+
+
+def benchmark_summarize_log_file(log_file: str = "big.log", size_mb: int = 200) -> None:
+    """
+    Task (Rank 5+):
+    - Create (once) a log of about `size_mb` MB and compare the three
+      summarize functions: run time and peak Python memory (tracemalloc).
+
+    Notes:
+    - Use size_mb=4096 or more to see the streaming/mmap versions stay flat
+      while `summarize_log_file` grows with the file.
+    """
+    path = Path(log_file)
+    if not path.exists() or path.stat().st_size < size_mb * 1024 * 1024:
+        line = "[0000000] INFO user=42 action=login status=ok\n"
+        block = line * (CHUNK_SIZE // len(line))
+        with path.open("w", encoding="utf-8") as f:
+            for _ in range(size_mb):
+                f.write(block)
+
+    for func in (summarize_log_file, summarize_log_file_streaming, summarize_log_file_mmap):
+        tracemalloc.start()
+        start = time.perf_counter()
+        summary = func(log_file)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{func.__name__:32} {elapsed:7.2f} s  "
+            f"peak {peak / 1024 / 1024:9.1f} MB  lines={summary['line_count']}"
+        )
+
+
+COPY_CHUNK_SIZE = 8 * 1024 * 1024  # bytes per kernel copy call / progress step
+
+
+def _copy_file_into(source: str, dst, buffer: bytearray, progress, done: int, total: int) -> int:
+    """
+    Helper:
+    - Append all bytes of `source` to the open binary file `dst`.
+    - Fastest available strategy first, falling back when the OS refuses:
+        1. `os.copy_file_range` (Linux: copy inside the kernel, may reflink).
+        2. `os.sendfile` (kernel copy between file descriptors).
+        3. `readinto` a reusable buffer (works everywhere, no per-chunk allocations).
+    - Calls `progress(done, total)` after every chunk, if given.
+
+    Returns:
+        The updated `done` byte counter.
+    """
+    dst.flush()  # fd-level copies must not overtake Python's write buffer
+    out_fd = dst.fileno()
+
+    with open(source, "rb") as src:
+        in_fd = src.fileno()
+        size = os.fstat(in_fd).st_size
+        offset = 0
+
+        for kernel_copy in ("copy_file_range", "sendfile"):
+            if offset >= size or not hasattr(os, kernel_copy):
+                continue
+            try:
+                while offset < size:
+                    count = min(COPY_CHUNK_SIZE, size - offset)
+                    if kernel_copy == "copy_file_range":
+                        sent = os.copy_file_range(in_fd, out_fd, count, offset)
+                    else:
+                        sent = os.sendfile(out_fd, in_fd, offset, count)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    done += sent
+                    if progress is not None:
+                        progress(done, total)
+            except OSError:
+                # Not supported for this pair of files (other filesystem,
+                # old kernel, non-Linux OS...). Continue with the next strategy.
+                pass
+
+        if offset < size:
+            if not buffer:
+                buffer.extend(bytearray(COPY_CHUNK_SIZE))  # allocated once, on first use
+            src.seek(offset)
+            view = memoryview(buffer)
+            while True:
+                n = src.readinto(buffer)
+                if not n:
+                    break
+                dst.write(view[:n])
+                done += n
+                if progress is not None:
+                    progress(done, total)
+
+    return done
+
+
+def concat_files_fast(
+    sources: list[str],
+    target: str,
+    separator: bytes = b"",
+    progress=None,
+) -> int:
+    """
+    Task (Rank 5+):
+    - Byte-level version of `copy_text_file` / `merge_two_files`.
+    - Write every file in `sources` into `target`, with `separator` between them.
+    - No decoding / re-encoding and no whole-file strings: data goes through
+      the kernel (or one reused buffer), so memory stays flat for any size.
+    - `progress(bytes_done, bytes_total)` is called as data is copied.
+
+    Returns:
+        Number of bytes written to `target`.
+    """
+    total = sum(os.path.getsize(source) for source in sources)
+    total += len(separator) * max(len(sources) - 1, 0)
+    buffer = bytearray()  # shared fallback buffer for all sources
+    done = 0
+
+    with open(target, "wb") as dst:
+        for i, source in enumerate(sources):
+            if i > 0 and separator:
+                dst.write(separator)
+                done += len(separator)
+            done = _copy_file_into(source, dst, buffer, progress, done, total)
+
+    return done
+
+
+def copy_file_fast(source: str, target: str, progress=None) -> int:
+    """
+    Task (Rank 5+):
+    - Same result as `copy_text_file`, copied byte for byte (see `concat_files_fast`).
+    """
+    return concat_files_fast([source], target, progress=progress)
+
+
+def merge_two_files_fast(file_a: str, file_b: str, target: str, progress=None) -> int:
+    """
+    Task (Rank 5+):
+    - Same result as `merge_two_files`, copied byte for byte (see `concat_files_fast`).
+    """
+    return concat_files_fast([file_a, file_b], target, b"\n-----\n", progress)
+
+
+def _measure_copy(func_name: str, source: str, target: str) -> tuple[float, int]:
+    """
+    Helper (runs in a fresh process):
+    - Time one copy function and report the process peak RSS in KB.
+    """
+    import resource  # Unix only, so imported where it's needed.
+
+    start = time.perf_counter()
+    globals()[func_name](source, target)
+    elapsed = time.perf_counter() - start
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def benchmark_copy(sizes_mb: tuple[int, ...] = (1, 64, 512)) -> None:
+    """
+    Task (Rank 5+):
+    - Compare `copy_text_file` with `copy_file_fast` on generated text files.
+    - Each run happens in a fresh process, so "peak RSS" belongs to that run only.
+
+    Notes:
+    - Pass sizes_mb=(1, 64, 1024, 4096) for the full 1 MB – 4 GB comparison
+      (the 4 GB `copy_text_file` run needs well over 8 GB of RAM).
+    """
+    line = "2025-01-01 12:00:00 INFO some log text to copy around\n"
+    block = line * (1024 * 1024 // len(line) + 1)
+    block = block[:1024 * 1024]
+    context = multiprocessing.get_context("spawn")
+
+    for size_mb in sizes_mb:
+        source = f"copy_source_{size_mb}mb.txt"
+        if not os.path.exists(source) or os.path.getsize(source) != size_mb * 1024 * 1024:
+            with open(source, "w", encoding="utf-8") as f:
+                for _ in range(size_mb):
+                    f.write(block)
+
+        for func_name in ("copy_text_file", "copy_file_fast"):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                elapsed, peak_kb = pool.submit(
+                    _measure_copy, func_name, source, source + ".copy"
+                ).result()
+            print(
+                f"{size_mb:6} MB  {func_name:16} {size_mb / elapsed:9.1f} MB/s  "
+                f"peak RSS {peak_kb / 1024:8.1f} MB"
+            )
+        os.remove(source + ".copy")
+
+
+class ConfigStore:
+    """
+    Task (Rank 5+):
+    - Indexed replacement for calling `read_config_key` once per key.
+    - The "key=value" file is parsed ONCE into a dict (same rules as
+      `read_config_key`: comments/blank lines skipped, first key wins).
+    - Each lookup only does a cheap `stat()`; the file is parsed again only
+      when its modification time or size changed.
+    - Counters:
+        hits    -> lookups that found the key
+        misses  -> lookups that returned the default
+        reloads -> how many times the file was (re)parsed
+
+    Example:
+        store = ConfigStore("config.ini")
+        store.get("theme", "light")
+        store.get_many(["username", "theme"])
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self._values: dict[str, str] = {}
+        self._signature: tuple[int, int] | None = None
+
+    def _parse(self) -> dict[str, str]:
+        values: dict[str, str] = {}
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                stripped = line.strip()
+                if not stripped or stripped.startswith("#") or "=" not in stripped:
+                    continue
+                k, v = stripped.split("=", maxsplit=1)
+                values.setdefault(k.strip(), v.strip())
+        return values
+
+    def _refresh(self) -> None:
+        """Reparse the file only if (mtime, size) changed since the last load."""
+        try:
+            stat = self.path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        if self.reloads and signature == self._signature:
+            return
+
+        self._values = self._parse() if signature is not None else {}
+        self._signature = signature
+        self.reloads += 1
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        """Same result as `read_config_key(path, key, default)`."""
+        self._refresh()
+        if key in self._values:
+            self.hits += 1
+            return self._values[key]
+        self.misses += 1
+        return default
+
+    def get_many(self, keys: list[str], default: str | None = None) -> dict[str, str | None]:
+        """Look up many keys with a single freshness check."""
+        self._refresh()
+        result: dict[str, str | None] = {}
+        for key in keys:
+            if key in self._values:
+                self.hits += 1
+                result[key] = self._values[key]
+            else:
+                self.misses += 1
+                result[key] = default
+        return result
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit/miss/reload counters."""
+        return {"hits": self.hits, "misses": self.misses, "reloads": self.reloads}
+
+
 # ============================================================
 # Optional: Quick manual test area
 # (I can run this file directly to see some basic behavior.)
@@ -345,11 +890,19 @@ if __name__ == "__main__":
 
     copy_text_file("movies.txt", "movies_copy.txt")
     print("Movies copy line & char count:", count_lines_and_characters("movies_copy.txt"))
+    copy_file_fast("movies.txt", "movies_copy_fast.txt")
+    print("Fast copy identical:", read_lines_strip("movies_copy_fast.txt") == read_lines_strip("movies.txt"))
 
     append_log_message("app.log", "Application started")
     append_log_message("app.log", "User logged in")
     print("Log summary:", summarize_log_file("app.log"))
 
+    append_log_messages("app_indexed.log", ["Application started", "User logged in"])
+    append_log_message_indexed("app_indexed.log", "User logged out")
+    print("Indexed log (count, offset):", load_log_index("app_indexed.log"))
+    print("Streaming log summary:", summarize_log_file_streaming("app_indexed.log"))
+    print("mmap log summary:", summarize_log_file_mmap("app_indexed.log"))
+
     report_path = write_report(
         "daily_report.txt",
         "Daily Report",
@@ -362,3 +915,7 @@ if __name__ == "__main__":
     sample_config = Path("config.ini")
     sample_config.write_text("username=admin\ntheme=dark\n", encoding="utf-8")
     print("Theme from config:", read_config_key("config.ini", "theme", default="light"))
+
+    store = ConfigStore("config.ini")
+    print("Config values:", store.get_many(["username", "theme", "language"]))
+    print("Config store stats:", store.stats())
@@ -13,8 +13,14 @@ Covers:
 - Validation patterns
 - Exception chaining
 - Professional workflow design
+- Columnar batch validation (Rank 5+)
 """
 
+import re
+import time
+from array import array
+from itertools import compress
+
 
 # =============================================================================
 # Rank 1 — Beginner
@@ -225,6 +231,250 @@ def batch_process(values):
     return result
 
 
+# =============================================================================
+# Rank 5+ — Performance: columnar batch validation
+# =============================================================================
+
+# One bit per failed check. Bits are ordered like the checks in
+# process_user_record(), so the lowest set bit is the error that function
+# would have reported first.
+ERR_MISSING_NAME = 1 << 0
+ERR_MISSING_AGE = 1 << 1
+ERR_MISSING_EMAIL = 1 << 2
+ERR_NAME_TYPE = 1 << 3
+ERR_NAME_EMPTY = 1 << 4
+ERR_AGE_NOT_INT = 1 << 5
+ERR_AGE_NOT_POSITIVE = 1 << 6
+ERR_EMAIL_TYPE = 1 << 7
+ERR_EMAIL_FORMAT = 1 << 8
+
+ERROR_MESSAGES = {
+    ERR_MISSING_NAME: "Invalid record: missing field 'name'",
+    ERR_MISSING_AGE: "Invalid record: missing field 'age'",
+    ERR_MISSING_EMAIL: "Invalid record: missing field 'email'",
+    ERR_NAME_TYPE: "Invalid record: name must be a string",
+    ERR_NAME_EMPTY: "Invalid record: name cannot be empty",
+    ERR_AGE_NOT_INT: "Invalid record: age must be an integer",
+    ERR_AGE_NOT_POSITIVE: "Invalid record: age must be positive",
+    ERR_EMAIL_TYPE: "Invalid record: email must be a string",
+    ERR_EMAIL_FORMAT: "Invalid record: invalid email format",
+}
+
+# Stricter than the "@" rule of process_user_record(); opt in with
+# validate_user_columns(..., strict_email=True).
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+MISSING = object()
+"""Placeholder for an absent field in column input."""
+
+INT_CHUNK = 4096
+
+
+def coerce_int_column(values):
+    """
+    int() every value; return (ints, bad) where bad[i] is True when
+    values[i] failed, and ints[i] is then None.
+
+    Each chunk is first tried with a single map(int, chunk), which runs the
+    loop in C. Only chunks that contain a bad value fall back to the
+    per-item try/except, so clean data never pays for exception handling.
+    """
+    ints = []
+    bad = []
+    for start in range(0, len(values), INT_CHUNK):
+        chunk = values[start:start + INT_CHUNK]
+        try:
+            converted = list(map(int, chunk))
+        except (ValueError, TypeError):
+            pass
+        else:
+            ints.extend(converted)
+            bad.extend([False] * len(chunk))
+            continue
+        for v in chunk:
+            try:
+                ints.append(int(v))
+                bad.append(False)
+            except (ValueError, TypeError):
+                ints.append(None)
+                bad.append(True)
+    return ints, bad
+
+
+def _name_code(name):
+    if name is MISSING:
+        return ERR_MISSING_NAME
+    if not isinstance(name, str):
+        return ERR_NAME_TYPE
+    return 0 if name else ERR_NAME_EMPTY
+
+
+def _age_code(age):
+    if age is MISSING:
+        return ERR_MISSING_AGE
+    try:
+        value = int(age)
+    except (ValueError, TypeError):
+        return ERR_AGE_NOT_INT
+    return 0 if value > 0 else ERR_AGE_NOT_POSITIVE
+
+
+def _email_code(email, email_ok):
+    if email is MISSING:
+        return ERR_MISSING_EMAIL
+    if not isinstance(email, str):
+        return ERR_EMAIL_TYPE
+    return 0 if email_ok(email) else ERR_EMAIL_FORMAT
+
+
+def validate_user_columns(names, ages, emails, strict_email=False):
+    """
+    Validate user records given as three equal-length columns.
+
+    Returns array('H') with one bitmask per row (0 == valid). Each column
+    is checked in its own comprehension: the common case (exact str / int
+    that passes) is decided inline, and only unusual values reach the
+    helper with the try/except. Use MISSING for absent fields;
+    error_message() turns a mask back into the row-wise text.
+    """
+    if not len(names) == len(ages) == len(emails):
+        raise ValueError("Columns must have the same length")
+
+    name_codes = [
+        0 if n.__class__ is str and n else _name_code(n)
+        for n in names
+    ]
+    # Ages have tiny cardinality ("29", "x", "" ...), so the code of every
+    # non-int value is computed once per call and then looked up, instead
+    # of raising the same ValueError again for every repeated bad value.
+    seen = {}
+
+    def age_code_cached(a):
+        try:
+            return seen[a]
+        except KeyError:
+            code = seen[a] = _age_code(a)
+            return code
+        except TypeError:  # unhashable value
+            return _age_code(a)
+
+    age_codes = [
+        (0 if a > 0 else ERR_AGE_NOT_POSITIVE) if a.__class__ is int else age_code_cached(a)
+        for a in ages
+    ]
+
+    if strict_email:
+        match = EMAIL_RE.fullmatch
+        email_codes = [
+            0 if e.__class__ is str and match(e) else
+            _email_code(e, lambda x: match(x) is not None)
+            for e in emails
+        ]
+    else:
+        email_codes = [
+            0 if e.__class__ is str and "@" in e else
+            _email_code(e, lambda x: "@" in x)
+            for e in emails
+        ]
+
+    # Most rows are valid, so OR in only the non-zero codes; compress()
+    # finds them in C instead of zipping three full columns in Python.
+    masks = array("H", name_codes)
+    for codes in (age_codes, email_codes):
+        for i in compress(range(len(codes)), codes):
+            masks[i] |= codes[i]
+    return masks
+
+
+def records_to_columns(records):
+    """Split a list of record dicts into (names, ages, emails) columns."""
+    columns = []
+    for key in ("name", "age", "email"):
+        try:
+            columns.append([r[key] for r in records])
+        except KeyError:
+            columns.append([r.get(key, MISSING) for r in records])
+    return tuple(columns)
+
+
+def error_message(mask):
+    """
+    Row-wise text for one bitmask, identical to process_user_record().
+
+    A missing field stops process_user_record() before any other check,
+    so the missing-field bits win; otherwise the lowest bit is reported.
+    """
+    if mask == 0:
+        return "Record OK"
+    return ERROR_MESSAGES[mask & -mask]
+
+
+def process_user_records(records, strict_email=False):
+    """
+    Batch version of process_user_record(): one message per record.
+
+    Same strings as [process_user_record(r) for r in records] with the
+    default strict_email=False.
+    """
+    masks = validate_user_columns(*records_to_columns(records), strict_email=strict_email)
+    lookup = {m: error_message(m) for m in set(masks)}
+    return [lookup[m] for m in masks]
+
+
+def batch_process_columnar(values):
+    """
+    batch_process() on a whole column: same {"success", "failed"} result,
+    using coerce_int_column() instead of one try/except per item.
+    """
+    ints, bad = coerce_int_column(values)
+    if not any(bad):
+        return {"success": ints, "failed": []}
+    return {
+        "success": [i for i, failed in zip(ints, bad) if not failed],
+        "failed": [v for v, failed in zip(values, bad) if failed],
+    }
+
+
+def benchmark_validation(n=1_000_000):
+    """
+    Time row-wise process_user_record() against the columnar engine on
+    n records (~10% invalid). Returns seconds per strategy.
+    """
+    templates = [
+        {"name": "Peyman", "age": 43, "email": "p@example.com"},
+        {"name": "Ana", "age": "29", "email": "ana@example.com"},
+        {"name": "Luis", "age": 31, "email": "luis@example.com"},
+        {"name": "Maria", "age": 25, "email": "maria@example.com"},
+        {"name": "Carlos", "age": 52, "email": "c@example.com"},
+        {"name": "Eva", "age": 38, "email": "eva@example.com"},
+        {"name": "Sam", "age": 19, "email": "sam@example.com"},
+        {"name": "Kim", "age": 61, "email": "kim@example.com"},
+        {"name": "Lea", "age": 27, "email": "lea@example.com"},
+        {"name": "", "age": "x", "email": "broken"},
+    ]
+    records = [templates[i % len(templates)] for i in range(n)]
+    columns = records_to_columns(records)
+    timings = {}
+
+    start = time.perf_counter()
+    expected = [process_user_record(r) for r in records]
+    timings["row-wise"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = process_user_records(records)
+    timings["records -> columns"] = time.perf_counter() - start
+    assert got == expected
+
+    start = time.perf_counter()
+    masks = validate_user_columns(*columns)
+    timings["columns only"] = time.perf_counter() - start
+    assert sum(1 for m in masks if m) == sum(1 for e in expected if e != "Record OK")
+
+    for name, seconds in timings.items():
+        print(f"  {name:<20} {seconds:7.3f}s  ({n / seconds:,.0f} records/s)")
+    return timings
+
+
 # =============================================================================
 # Optional Self-Test
 # =============================================================================
@@ -248,3 +498,12 @@ if __name__ == "__main__":
 
     print(process_user_record({"name": "Peyman", "age": 43, "email": "p@example.com"}))
     print(batch_process(["10", "x", 25]))
+
+    masks = validate_user_columns(
+        ["Peyman", "", 7, "Ana"],
+        [43, "x", 20, MISSING],
+        ["p@example.com", "bad", None, "a@example.com"],
+    )
+    print(list(masks), [error_message(m) for m in masks])
+    print(batch_process_columnar(["10", "x", 25]))
+    benchmark_validation(n=200_000)
@@ -138,3 +138,153 @@ def normalize(arr):
 def binary_header(version, size):
     header = array('I', [version, size])
     return header, header.tobytes()
+
+
+# ---------------------------------------------------------------------------
+# ⭐ RANK 5+ — PERFORMANCE
+# ---------------------------------------------------------------------------
+
+# 26.
+# File-backed typed array: serialize_floats / deserialize_floats for columns
+# too big to copy into memory.
+#
+# File layout (16 bytes of header, so 8-byte items stay aligned):
+#     b"TARR" | typecode (1 byte) | 3 padding bytes | binary_header(version, count)
+#     followed by `count` raw items in native byte order
+#
+# The data is opened with mmap + memoryview.cast(typecode): indexing reads
+# straight from the page cache, only touched pages are loaded, and in-place
+# edits go back to the file. (count is a 32-bit "I" field, so up to ~4.29
+# billion items per file.)
+import io
+import mmap
+
+TYPED_ARRAY_MAGIC = b"TARR"
+TYPED_ARRAY_VERSION = 1
+TYPED_ARRAY_HEADER_SIZE = 16
+TYPED_ARRAY_CHUNK = 1 << 20  # items processed per step by scale()/normalize()
+
+class TypedArrayFile:
+    def __init__(self, path, writable=True):
+        self.path = path
+        self.file = open(path, "r+b" if writable else "rb")
+        self.writable = writable
+        header = self.file.read(TYPED_ARRAY_HEADER_SIZE)
+        if len(header) != TYPED_ARRAY_HEADER_SIZE or header[:4] != TYPED_ARRAY_MAGIC:
+            self.file.close()
+            raise ValueError(f"{path} is not a typed array file")
+        self.typecode = chr(header[4])
+        version, self.count = array('I', header[8:16])
+        if version != TYPED_ARRAY_VERSION:
+            self.file.close()
+            raise ValueError(f"unsupported typed array version: {version}")
+        self.itemsize = array(self.typecode).itemsize
+        self._map()
+
+    @classmethod
+    def create(cls, path, typecode, values=()):
+        _, header_bytes = binary_header(TYPED_ARRAY_VERSION, 0)
+        with open(path, "wb") as f:
+            f.write(TYPED_ARRAY_MAGIC + typecode.encode("ascii") + b"\x00" * 3 + header_bytes)
+        column = cls(path)
+        if values:
+            column.append_many(values)
+        return column
+
+    @classmethod
+    def from_array(cls, path, arr):
+        # serialize_floats(), straight to disk.
+        return cls.create(path, arr.typecode, arr)
+
+    def _map(self):
+        size = TYPED_ARRAY_HEADER_SIZE + self.count * self.itemsize
+        if self.count == 0:
+            self.mm = None
+            self.view = memoryview(array(self.typecode))
+            return
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        self.mm = mmap.mmap(self.file.fileno(), size, access=access)
+        self.view = memoryview(self.mm)[TYPED_ARRAY_HEADER_SIZE:].cast(self.typecode)
+
+    def _unmap(self):
+        # A slice handed out by __getitem__ keeps the map exported, and then
+        # mmap.close() fails. In that case the view is rebuilt over the
+        # still-open map, so the object is unchanged and usable.
+        self.view.release()
+        if self.mm is None:
+            return
+        try:
+            self.mm.close()
+        except BufferError:
+            self.view = memoryview(self.mm)[TYPED_ARRAY_HEADER_SIZE:].cast(self.typecode)
+            raise BufferError(
+                "memoryview slices of this TypedArrayFile are still in use; "
+                "release them before append_many() or close()"
+            ) from None
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        # int -> item, slice -> zero-copy memoryview into the file.
+        return self.view[index]
+
+    def __setitem__(self, index, value):
+        self.view[index] = value
+
+    def to_array(self, start=0, stop=None):
+        # deserialize_floats() for just the part that is needed.
+        return array(self.typecode, self.view[start:stop])
+
+    def append_many(self, values):
+        # Batched append: one write for the whole batch, then one header update.
+        if not isinstance(values, array) or values.typecode != self.typecode:
+            values = array(self.typecode, values)
+        if not self.writable:
+            raise io.UnsupportedOperation(f"{self.path} was opened read-only")
+        if self.count + len(values) > 0xFFFFFFFF:
+            raise OverflowError("typed array file is limited to 2**32 - 1 items")
+        self._unmap()
+        try:
+            self.file.seek(TYPED_ARRAY_HEADER_SIZE + self.count * self.itemsize)
+            values.tofile(self.file)
+            # The count is written last: after a crash the file still shows the old length.
+            self.file.flush()
+            self.file.seek(8)
+            self.file.write(binary_header(TYPED_ARRAY_VERSION, self.count + len(values))[1])
+            self.file.flush()
+            self.count += len(values)
+        finally:
+            # Map again even if the write failed, so the view is never left released.
+            self._map()
+
+    def _apply(self, func, start, stop):
+        # Run func over chunks of the column, writing each chunk back in place.
+        stop = self.count if stop is None else stop
+        for chunk_start in range(start, stop, TYPED_ARRAY_CHUNK):
+            chunk_stop = min(chunk_start + TYPED_ARRAY_CHUNK, stop)
+            chunk = array(self.typecode, map(func, self.view[chunk_start:chunk_stop]))
+            self.view[chunk_start:chunk_stop] = chunk
+
+    def scale(self, factor, start=0, stop=None):
+        # scale_array(), without loading the whole column.
+        self._apply(lambda x: x * factor, start, stop)
+
+    def normalize(self, start=0, stop=None):
+        # normalize(), without loading the whole column.
+        self._apply(lambda x: x % 101, start, stop)
+
+    def flush(self):
+        if self.mm is not None:
+            self.mm.flush()
+
+    def close(self):
+        self.flush()
+        self._unmap()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -204,3 +204,250 @@ def update_price_file(filename, percent):
     with open(filename, "w") as f:
         for line in updated:
             f.write(line + "\n")
+
+
+# ---------------------------------------------------------------------------
+# ⭐ RANK 5+ — PERFORMANCE
+# ---------------------------------------------------------------------------
+
+# 26.
+# Streaming version of update_price_file for very large price files:
+# - reads and writes line by line, never holding the whole file in memory
+# - writes into a temp file in big batches, then swaps it in with os.replace
+#   (readers see either the old file or the new one, never half of each)
+# - `rules` is a list of (product_prefix, percent) pairs; every matching rule
+#   is applied in order, so one pass == calling update_price_file once per rule
+import os
+import shutil
+import tempfile
+import time
+
+def update_price_file_streaming(filename, percent=0, rules=None, batch_lines=50_000):
+    if rules is None:
+        rules = [("", percent)]
+    rules = [(prefix, pct / 100) for prefix, pct in rules]
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".prices-", suffix=".tmp")
+    start = time.perf_counter()
+    rows = 0
+    try:
+        with open(filename, "r") as f_src, os.fdopen(fd, "w", buffering=1024 * 1024) as f_out:
+            batch = []
+            for line in f_src:
+                product, price = line.strip().split(":")
+                price = int(price)
+                for prefix, factor in rules:
+                    if product.startswith(prefix):
+                        price = int(price + price * factor)
+                batch.append(f"{product}:{price}\n")
+                if len(batch) >= batch_lines:
+                    f_out.write("".join(batch))
+                    rows += len(batch)
+                    batch.clear()
+            f_out.write("".join(batch))
+            rows += len(batch)
+        shutil.copymode(filename, tmp_path)  # mkstemp creates the file as 0600
+        os.replace(tmp_path, filename)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    seconds = time.perf_counter() - start
+    return {"rows": rows, "seconds": seconds, "rows_per_sec": rows / seconds if seconds else 0.0}
+
+
+# 27.
+# Log-structured store for add_item / get_all_items and save_user / load_users.
+# - every write is APPENDED to the data file as one record line:
+#       P<TAB>key<TAB>value      (put)
+#       D<TAB>key                (delete / tombstone)
+# - an in-memory dict maps key -> (offset, length) of its latest record, so
+#   get(key) is one seek + one small read instead of a full scan
+# - writes are collected and committed in groups (one write + flush per batch)
+# - compact() rewrites only live records once too many records are dead
+#
+# Example:
+#     with LogStore("database.db") as db:
+#         db.put("item-1", "keyboard")          # add_item
+#         db.put("luis", "25")                  # save_user
+#         db.get("luis")                        # -> "25"
+#         list(db.items())                      # get_all_items / load_users
+class LogStore:
+    def __init__(self, filename, batch_size=1000, compact_ratio=0.5, compact_min_records=10_000):
+        self.filename = filename
+        self.batch_size = batch_size
+        self.compact_ratio = compact_ratio
+        self.compact_min_records = compact_min_records
+        self.index = {}       # key -> (offset, length) in the data file
+        self.pending = {}     # key -> value (None = delete), not yet on disk
+        self.pending_records = []
+        self.records = 0      # records in the data file, live or dead
+        self._load_index()
+        self.file = open(filename, "ab")
+        self.reader = open(filename, "rb")  # one handle reused by every get()
+
+    def _load_index(self):
+        # One sequential scan at startup rebuilds the index.
+        try:
+            with open(self.filename, "rb") as f:
+                offset = 0
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # torn write from a crash: ignore the partial record
+                    kind, key = line.rstrip(b"\n").split(b"\t", 2)[:2]
+                    key = key.decode("utf-8")
+                    if kind == b"P":
+                        self.index[key] = (offset, len(line))
+                    else:
+                        self.index.pop(key, None)
+                    self.records += 1
+                    offset += len(line)
+            if offset != os.path.getsize(self.filename):
+                os.truncate(self.filename, offset)
+        except FileNotFoundError:
+            pass
+
+    def _append(self, key, value):
+        if "\t" in key or "\n" in key or (value is not None and "\n" in value):
+            raise ValueError("keys cannot contain tabs/newlines, values cannot contain newlines")
+        self.pending[key] = value
+        self.pending_records.append((key, value))
+        if len(self.pending_records) >= self.batch_size:
+            self.flush()
+
+    def put(self, key, value):
+        self._append(key, value)
+
+    def delete(self, key):
+        if key in self:
+            self._append(key, None)
+
+    def get(self, key, default=None):
+        if key in self.pending:
+            value = self.pending[key]
+            return default if value is None else value
+        location = self.index.get(key)
+        if location is None:
+            return default
+        offset, length = location
+        self.reader.seek(offset)
+        line = self.reader.read(length)
+        return line.rstrip(b"\n").split(b"\t", 2)[2].decode("utf-8")
+
+    def __contains__(self, key):
+        if key in self.pending:
+            return self.pending[key] is not None
+        return key in self.index
+
+    def __len__(self):
+        self.flush()
+        return len(self.index)
+
+    def items(self):
+        # Live (key, value) pairs in the order they were last written.
+        self.flush()
+        with open(self.filename, "rb") as f:
+            for key, (offset, length) in sorted(self.index.items(), key=lambda kv: kv[1][0]):
+                f.seek(offset)
+                line = f.read(length)
+                yield key, line.rstrip(b"\n").split(b"\t", 2)[2].decode("utf-8")
+
+    def flush(self):
+        # Group commit: one write() + flush() for the whole batch.
+        if not self.pending_records:
+            return
+        offset = self.file.tell()
+        chunks = []
+        for key, value in self.pending_records:
+            if value is None:
+                record = f"D\t{key}\n".encode("utf-8")
+                self.index.pop(key, None)
+            else:
+                record = f"P\t{key}\t{value}\n".encode("utf-8")
+                self.index[key] = (offset, len(record))
+            chunks.append(record)
+            offset += len(record)
+        self.file.write(b"".join(chunks))
+        self.file.flush()
+        self.records += len(self.pending_records)
+        self.pending_records.clear()
+        self.pending.clear()
+
+        dead = self.records - len(self.index)
+        if self.records >= self.compact_min_records and dead > self.records * self.compact_ratio:
+            self.compact()
+
+    def compact(self):
+        # Copy only the live records into a new file, then swap it in.
+        self.flush()
+        tmp_name = self.filename + ".compact"
+        new_index = {}
+        with open(self.filename, "rb") as f_src, open(tmp_name, "wb") as f_out:
+            offset = 0
+            for key, (old_offset, length) in sorted(self.index.items(), key=lambda kv: kv[1][0]):
+                f_src.seek(old_offset)
+                f_out.write(f_src.read(length))
+                new_index[key] = (offset, length)
+                offset += length
+        self.file.close()
+        self.reader.close()
+        os.replace(tmp_name, self.filename)
+        self.index = new_index
+        self.records = len(new_index)
+        self.file = open(self.filename, "ab")
+        self.reader = open(self.filename, "rb")
+
+    def close(self):
+        self.flush()
+        self.file.close()
+        self.reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# 28.
+# Throughput of LogStore vs. add_item / get_all_items.
+# (The old functions are measured on a smaller sample: every add_item reopens
+# the file and every lookup through get_all_items reads the whole file.)
+def benchmark_log_store(n=1_000_000, baseline_n=20_000, lookups=1000):
+    import random
+
+    # add_item()/get_all_items() use database.txt in the current directory,
+    # so run everything from a scratch directory to leave the real one alone.
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            start = time.perf_counter()
+            for i in range(baseline_n):
+                add_item(f"item-{i}")
+            elapsed = time.perf_counter() - start
+            print(f"add_item:           {baseline_n / elapsed:12,.0f} inserts/s")
+
+            start = time.perf_counter()
+            for i in range(lookups // 100):
+                f"item-{i}" in get_all_items()
+            elapsed = time.perf_counter() - start
+            print(f"get_all_items scan: {lookups // 100 / elapsed:12,.0f} lookups/s")
+
+            with LogStore("bench.db") as db:
+                start = time.perf_counter()
+                for i in range(n):
+                    db.put(f"item-{i}", f"value-{i}")
+                db.flush()
+                elapsed = time.perf_counter() - start
+                print(f"LogStore.put:       {n / elapsed:12,.0f} inserts/s")
+
+                keys = [f"item-{random.randrange(n)}" for _ in range(lookups)]
+                start = time.perf_counter()
+                for key in keys:
+                    db.get(key)
+                elapsed = time.perf_counter() - start
+                print(f"LogStore.get:       {lookups / elapsed:12,.0f} lookups/s")
+        finally:
+            os.chdir(cwd)
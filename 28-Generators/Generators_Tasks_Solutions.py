@@ -8,6 +8,15 @@ This file contains clean and professional solutions
 for the generator exercises in this module.
 """
 
+import asyncio
+import inspect
+import mmap
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 # ---------------------------------------------------------------------------
 # Rank 1 — Beginner
 # ---------------------------------------------------------------------------
@@ -101,6 +110,307 @@ def log_filter(logs, keyword):
             yield log
 
 
+# ---------------------------------------------------------------------------
+# Rank 5+ — Performance
+# ---------------------------------------------------------------------------
+
+# Task 11 Solution
+# Parallel grep: the file is cut into newline-aligned byte ranges, each range
+# is scanned over mmap in a worker process, and only the matching lines are
+# sent back in their original order. Each range is lowercased once as bytes
+# (in C) instead of line by line, and non-matching lines are never decoded.
+#
+# A few keywords: one C-level find() pass per keyword is the fastest option.
+# Many keywords: they are merged into ONE alternation pattern, so the range
+# is scanned a single time no matter how many keywords there are.
+#
+# bytes.lower() folds ASCII letters only, so non-ASCII keywords switch the
+# range to a per-line scan: ASCII lines are still checked as bytes, and only
+# lines containing non-ASCII bytes are decoded and lowered with str.lower(),
+# exactly like filter_lines() / log_filter().
+
+GREP_CHUNK_SIZE = 8 * 1024 * 1024
+GREP_MAX_FIND_KEYWORDS = 4
+
+
+def _split_ranges(mm, size, chunk_size):
+    ranges = []
+    start = 0
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            newline_at = mm.find(b"\n", end)
+            end = size if newline_at == -1 else newline_at + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _prepare_keywords(keywords):
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    keywords = [k.lower() for k in keywords]
+    if not all(k.isascii() for k in keywords):
+        return keywords, None, True
+    keywords = [k.encode("ascii") for k in keywords]
+    if len(keywords) <= GREP_MAX_FIND_KEYWORDS:
+        return keywords, None, False
+    return keywords, re.compile(b"|".join(re.escape(k) for k in keywords)), False
+
+
+def _grep_chunk_text(chunk, keywords):
+    ascii_keywords = [k.encode("ascii") for k in keywords if k.isascii()]
+    lines = chunk.split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()
+
+    matches = []
+    for line in lines:
+        if line.isascii():
+            # An ASCII line can only contain the ASCII keywords.
+            lowered = line.lower()
+            if any(k in lowered for k in ascii_keywords):
+                matches.append(line)
+        else:
+            text = line.decode("utf-8", errors="replace").lower()
+            if any(k in text for k in keywords):
+                matches.append(line)
+    return matches
+
+
+def _grep_chunk(chunk, keywords, pattern, text_mode=False):
+    if text_mode:
+        return _grep_chunk_text(chunk, keywords)
+
+    lowered = chunk.lower()
+    size = len(lowered)
+
+    if pattern is None:
+        finders = [lambda pos, k=k: lowered.find(k, pos) for k in keywords]
+    else:
+        def find_any(pos):
+            match = pattern.search(lowered, pos)
+            return -1 if match is None else match.start()
+        finders = [find_any]
+
+    spans = {}
+    for find in finders:
+        pos = find(0)
+        while pos != -1 and pos < size:
+            line_start = lowered.rfind(b"\n", 0, pos) + 1
+            line_end = lowered.find(b"\n", pos)
+            if line_end == -1:
+                line_end = size
+            spans[line_start] = line_end
+            pos = find(line_end + 1)  # one hit per line is enough
+
+    return [chunk[start:end] for start, end in sorted(spans.items())]
+
+
+def _grep_worker(job):
+    filename, keywords, pattern, text_mode, start, end = job
+    with open(filename, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _grep_chunk(mm[start:end], keywords, pattern, text_mode)
+
+
+def grep_lines(filename, keywords, workers=None, chunk_size=GREP_CHUNK_SIZE):
+    try:
+        size = os.path.getsize(filename)
+    except FileNotFoundError:
+        return
+    if size == 0:
+        return
+
+    keywords, pattern, text_mode = _prepare_keywords(keywords)
+    with open(filename, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = _split_ranges(mm, size, chunk_size)
+            if workers == 1 or len(ranges) == 1:
+                for start, end in ranges:
+                    for line in _grep_chunk(mm[start:end], keywords, pattern, text_mode):
+                        yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+                return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Bounded submission: at most 2 ranges per worker in flight, so
+        # results never pile up when the consumer is slower than the
+        # workers. Futures are consumed in submission order, which is the
+        # original line order.
+        in_flight = 2 * (workers or os.cpu_count() or 1)
+        pending = deque()
+        for start, end in ranges:
+            job = (filename, keywords, pattern, text_mode, start, end)
+            pending.append(pool.submit(_grep_worker, job))
+            if len(pending) >= in_flight:
+                for line in pending.popleft().result():
+                    yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+        while pending:
+            for line in pending.popleft().result():
+                yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+# Task 12 Solution
+# Same job as filter_lines() in 27-Files, built on the parallel grep.
+def filter_lines_parallel(filename, keywords, output, workers=None):
+    count = 0
+    with open(output, "w", encoding="utf-8") as f_out:
+        for line in grep_lines(filename, keywords, workers=workers):
+            f_out.write(line + "\n")
+            count += 1
+    return count
+
+
+# Task 13 Solution
+# Compare the one-line-at-a-time filter with grep_lines() on a generated log.
+def benchmark_grep(filename="big_app.log", size_mb=200, keywords=("error", "timeout")):
+    if not os.path.exists(filename) or os.path.getsize(filename) < size_mb * 1024 * 1024:
+        lines = [
+            "2025-01-01 12:00:00 INFO request served in 12 ms\n",
+            "2025-01-01 12:00:01 DEBUG cache hit for user 42\n",
+            "2025-01-01 12:00:02 ERROR database unavailable\n",
+            "2025-01-01 12:00:03 WARN upstream Timeout after 30 s\n",
+        ] + ["2025-01-01 12:00:04 INFO heartbeat ok\n"] * 96
+        block = "".join(lines)
+        with open(filename, "w", encoding="utf-8") as f:
+            for _ in range(size_mb * 1024 * 1024 // len(block)):
+                f.write(block)
+
+    start = time.perf_counter()
+    lowered = [k.lower() for k in keywords]
+    slow = sum(
+        1
+        for log in file_line_reader(filename)
+        if any(k in log.lower() for k in lowered)
+    )
+    print(f"file_line_reader + lower(): {time.perf_counter() - start:6.2f} s  matches={slow}")
+
+    for workers in (1, None):
+        start = time.perf_counter()
+        fast = sum(1 for _ in grep_lines(filename, list(keywords), workers=workers))
+        label = f"grep_lines(workers={workers})"
+        print(f"{label:27} {time.perf_counter() - start:6.2f} s  matches={fast}")
+
+
+# Task 14 Solution
+# Async counterpart of file_line_reader: `async for line in aiter_lines(path)`.
+# - the blocking open()/read() run in a thread executor, so the event loop
+#   keeps serving other tasks while the disk works
+# - the file is read in big chunks (one syscall per chunk, not per line),
+#   split with bytes.split in C and decoded in the same executor call;
+#   a partial last line is carried over to the next chunk
+# - lines are stripped like file_line_reader; a missing file yields nothing
+
+ASYNC_READ_CHUNK = 1024 * 1024
+
+
+def _read_line_batch(file, chunk_size, rest):
+    # Runs in the executor thread: read + split + decode all happen off the loop.
+    chunk = file.read(chunk_size)
+    if not chunk:
+        return None, rest
+    lines = (rest + chunk).split(b"\n")
+    rest = lines.pop()
+    return [line.decode("utf-8", errors="replace").strip() for line in lines], rest
+
+
+async def aiter_line_batches(filename, chunk_size=ASYNC_READ_CHUNK):
+    loop = asyncio.get_running_loop()
+    try:
+        file = await loop.run_in_executor(None, open, filename, "rb")
+    except FileNotFoundError:
+        return
+    try:
+        rest = b""
+        while True:
+            batch, rest = await loop.run_in_executor(None, _read_line_batch, file, chunk_size, rest)
+            if batch is None:
+                break
+            yield batch
+        if rest:
+            yield [rest.decode("utf-8", errors="replace").strip()]
+    finally:
+        await loop.run_in_executor(None, file.close)
+
+
+async def aiter_lines(filename, chunk_size=ASYNC_READ_CHUNK):
+    async for batch in aiter_line_batches(filename, chunk_size):
+        for line in batch:
+            yield line
+
+
+# Task 15 Solution
+# Async composition helpers; func/predicate may be plain or async functions.
+async def amap(func, aiterable):
+    is_async = inspect.iscoroutinefunction(func)
+    async for item in aiterable:
+        yield (await func(item)) if is_async else func(item)
+
+
+async def afilter(predicate, aiterable):
+    is_async = inspect.iscoroutinefunction(predicate)
+    async for item in aiterable:
+        if (await predicate(item)) if is_async else predicate(item):
+            yield item
+
+
+async def alog_filter(filename, keyword):
+    # log_filter(file_line_reader(...)) without blocking the event loop.
+    async for line in afilter(lambda log: keyword in log, aiter_lines(filename)):
+        yield line
+
+
+# Task 16 Solution
+# Event-loop responsiveness while several big files are scanned at once.
+# A heartbeat task asks to wake up every 10 ms and records how late it was.
+async def _heartbeat(lags, stop, interval=0.01):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - expected)
+
+
+async def _count_blocking(filename):
+    return sum(1 for _ in file_line_reader(filename))  # blocks the loop
+
+
+async def _count_async(filename):
+    count = 0
+    async for batch in aiter_line_batches(filename):
+        count += len(batch)
+    return count
+
+
+def benchmark_async_reader(filenames=None, size_mb=1024, files=3):
+    if filenames is None:
+        filenames = [f"async_scan_{i}.log" for i in range(files)]
+        line = "2025-01-01 12:00:00 INFO user=42 action=login status=ok\n"
+        block = line * (1024 * 1024 // len(line))
+        for name in filenames:
+            if not os.path.exists(name) or os.path.getsize(name) < size_mb * len(block):
+                with open(name, "w", encoding="utf-8") as f:
+                    for _ in range(size_mb):
+                        f.write(block)
+
+    async def run(counter):
+        lags, stop = [], asyncio.Event()
+        beat = asyncio.create_task(_heartbeat(lags, stop))
+        start = time.perf_counter()
+        counts = await asyncio.gather(*(counter(name) for name in filenames))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await beat
+        worst = max(lags, default=elapsed) * 1000
+        print(
+            f"{counter.__name__:16} {elapsed:6.2f} s  lines={sum(counts):,}  "
+            f"heartbeats={len(lags)}  worst loop lag={worst:8.1f} ms"
+        )
+
+    for counter in (_count_blocking, _count_async):
+        asyncio.run(run(counter))
+
+
 # ---------------------------------------------------------------------------
 # Final Notes
 # ---------------------------------------------------------------------------
@@ -111,3 +421,4 @@ def log_filter(logs, keyword):
 #
 # Next Step:
 # Move on to the next module when ready.
+
@@ -204,6 +204,170 @@ for item in SafeListIterator(["a", "b", "c"]):
     print(item)
 
 
+# ---------------------------------------------------------------------------
+# Rank 5+ — Performance
+# ---------------------------------------------------------------------------
+
+# Task 11 Solution
+# Sequence versions of CountUp, EvenNumbers and RestartableRange.
+# Their values are just an arithmetic progression, so they can be backed by
+# a range object: len(), "in", indexing and slicing become O(1) like range,
+# and iterating runs in C instead of a Python __next__ per value.
+import math
+import time
+from collections.abc import Sequence
+
+
+class RangeBackedSequence(Sequence):
+    def __init__(self, values):
+        self._values = values  # a range
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __contains__(self, value):
+        return value in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def iter_from(self, index):
+        # Jump ahead: start iterating at `index` without visiting earlier values.
+        return iter(self._values[index:])
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self._values[:5])}{'...' if len(self) > 5 else ''})"
+
+
+class CountUpSequence(RangeBackedSequence):
+    def __init__(self, limit):
+        super().__init__(range(1, limit + 1))
+
+
+class EvenNumbersSequence(RangeBackedSequence):
+    def __init__(self, limit):
+        super().__init__(range(0, limit + 1, 2))
+
+
+class RestartableRangeSequence(RangeBackedSequence):
+    def __init__(self, start, end):
+        super().__init__(range(start, end + 1))
+
+
+# Task 12 Solution
+# Fast-doubling Fibonacci: F(n) in O(log n) big-int steps, using
+#     F(2k)   = F(k) * (2*F(k+1) - F(k))
+#     F(2k+1) = F(k)**2 + F(k+1)**2
+def fib_pair(n):
+    # Returns (F(n), F(n + 1)).
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a, b
+
+
+def fib(n):
+    return fib_pair(n)[0]
+
+
+def is_fibonacci(value):
+    # value is a Fibonacci number  <=>  5*value**2 + 4 or 5*value**2 - 4 is a square.
+    if value < 0:
+        return False
+    for candidate in (5 * value * value + 4, 5 * value * value - 4):
+        root = math.isqrt(candidate)
+        if root * root == candidate:
+            return True
+    return False
+
+
+class FibonacciSequence(Sequence):
+    # Same values as FibonacciIterator(max_value): 0, 1, 1, 2, 3, 5, ... <= max_value
+    def __init__(self, max_value):
+        self.max_value = max_value
+        self._length = self._count(max_value)
+
+    @staticmethod
+    def _count(max_value):
+        if max_value < 0:
+            return 0
+        if max_value < 2:
+            return 1 if max_value == 0 else 3  # [0] or [0, 1, 1]
+        phi = (1 + math.sqrt(5)) / 2
+        # Estimate the last index from F(n) ~ phi**n / sqrt(5), then correct it.
+        n = int((math.log(max_value) + math.log(5) / 2) / math.log(phi))
+        while fib(n + 1) <= max_value:
+            n += 1
+        while fib(n) > max_value:
+            n -= 1
+        return n + 1
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("FibonacciSequence index out of range")
+        return fib(index)
+
+    def __contains__(self, value):
+        return isinstance(value, int) and value <= self.max_value and is_fibonacci(value)
+
+    def __iter__(self):
+        return self.iter_from(0)
+
+    def iter_from(self, index):
+        # Jump ahead in O(log index), then continue with plain additions.
+        a, b = fib_pair(index)
+        for _ in range(index, self._length):
+            yield a
+            a, b = b, a + b
+
+
+print(len(CountUpSequence(10**12)), 999_999 in EvenNumbersSequence(10**9))
+print(FibonacciSequence(20)[:], 13 in FibonacciSequence(20), fib(100))
+
+
+# Task 13 Solution
+# Large-index access and membership: iterator classes vs. sequence versions.
+def benchmark_sequences(limit=10_000_000, fib_index=20_000):
+    def timed(label, func):
+        start = time.perf_counter()
+        result = func()
+        print(f"{label:45} {time.perf_counter() - start:10.6f} s")
+        return result
+
+    target = limit - 1
+    timed("CountUp: target in iterator", lambda: target in CountUp(limit))
+    timed("CountUpSequence: target in sequence", lambda: target in CountUpSequence(limit))
+    timed("EvenNumbers: len(list(iterator))", lambda: len(list(EvenNumbers(limit))))
+    timed("EvenNumbersSequence: len(sequence)", lambda: len(EvenNumbersSequence(limit)))
+
+    fib_limit = fib(fib_index)
+
+    def nth_by_iteration():
+        for i, value in enumerate(FibonacciIterator(fib_limit)):
+            if i == fib_index:
+                return value
+
+    slow = timed(f"FibonacciIterator: value #{fib_index}", nth_by_iteration)
+    fast = timed(f"fib({fib_index}) (fast doubling)", lambda: fib(fib_index))
+    assert slow == fast
+    timed(
+        "FibonacciSequence: F(n) in sequence",
+        lambda: fast in FibonacciSequence(fib_limit),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Final Notes
 # ---------------------------------------------------------------------------
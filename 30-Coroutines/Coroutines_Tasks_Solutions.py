@@ -187,6 +187,336 @@ coro.send(123)
 coro.close()
 
 
+# ---------------------------------------------------------------------------
+# Rank 5+ — Performance
+# ---------------------------------------------------------------------------
+
+# Task 11 Solution
+# Push-based dataflow engine: a generalization of sender -> square_processor.
+# - @coroutine primes every stage automatically (no more next(coro) lines)
+# - stages receive BATCHES (lists), not single values: one send() moves a
+#   whole list through the graph, so the generator-switch cost is paid once
+#   per batch instead of once per item
+# - map/filter run the batch through the built-in map()/filter() loops
+# - closing the first stage closes everything downstream
+import time
+from functools import wraps
+from itertools import islice
+
+
+def coroutine(func):
+    @wraps(func)
+    def start(*args, **kwargs):
+        coro = func(*args, **kwargs)
+        next(coro)
+        return coro
+    return start
+
+
+@coroutine
+def map_stage(func, target):
+    try:
+        while True:
+            batch = yield
+            target.send(list(map(func, batch)))
+    except GeneratorExit:
+        target.close()
+
+
+@coroutine
+def filter_stage(predicate, target):
+    try:
+        while True:
+            batch = yield
+            kept = list(filter(predicate, batch))
+            if kept:
+                target.send(kept)
+    except GeneratorExit:
+        target.close()
+
+
+@coroutine
+def broadcast(*targets):
+    try:
+        while True:
+            batch = yield
+            for target in targets:
+                target.send(batch)
+    except GeneratorExit:
+        for target in targets:
+            target.close()
+
+
+@coroutine
+def window_stage(size, target, step=None):
+    # Sliding windows of `size` items, moving `step` items at a time
+    # (step=size -> tumbling windows). Sends a batch of windows (tuples).
+    step = size if step is None else step
+    buffer = []
+    skip = 0  # items still to drop when step > size
+    try:
+        while True:
+            batch = yield
+            if skip:
+                dropped = min(skip, len(batch))
+                batch = batch[dropped:]
+                skip -= dropped
+            buffer.extend(batch)
+            last_start = len(buffer) - size
+            if last_start < 0:
+                continue
+            starts = range(0, last_start + 1, step)
+            target.send([tuple(buffer[i:i + size]) for i in starts])
+            next_start = starts[-1] + step
+            skip = max(next_start - len(buffer), 0)
+            del buffer[:next_start]
+    except GeneratorExit:
+        target.close()
+
+
+@coroutine
+def collect(results):
+    # Sink: extend `results` with every batch that arrives.
+    while True:
+        results.extend((yield))
+
+
+@coroutine
+def for_each(func):
+    # Sink: call func(item) for every item, like the print() sinks above.
+    while True:
+        for item in (yield):
+            func(item)
+
+
+def send_many(target, values, batch_size=1024):
+    # Push any iterable through the graph in lists of `batch_size` items.
+    values = iter(values)
+    while True:
+        batch = list(islice(values, batch_size))
+        if not batch:
+            return
+        target.send(batch)
+
+
+results = []
+graph = filter_stage(lambda v: v > 0, map_stage(lambda v: v ** 2, collect(results)))
+send_many(graph, [-2, 1, 2, 3])
+graph.close()
+print("Squared positives:", results)
+
+
+# Task 12 Solution
+# Messages/sec: one value per send() (Tasks 6 + 8 style) vs. batched send_many().
+def benchmark_dataflow(n=1_000_000, batch_size=1024):
+    @coroutine
+    def filter_one(predicate, target):
+        while True:
+            value = yield
+            if predicate(value):
+                target.send(value)
+
+    @coroutine
+    def map_one(func, target):
+        while True:
+            target.send(func((yield)))
+
+    @coroutine
+    def count_one(counter):
+        while True:
+            yield
+            counter[0] += 1
+
+    @coroutine
+    def count_batches(counter):
+        while True:
+            counter[0] += len((yield))
+
+    values = range(-n // 2, n // 2)
+    predicate, func = (lambda v: v > 0), (lambda v: v ** 2)
+
+    counter = [0]
+    head = filter_one(predicate, map_one(func, count_one(counter)))
+    start = time.perf_counter()
+    for value in values:
+        head.send(value)
+    print(f"one value per send: {n / (time.perf_counter() - start):14,.0f} msg/s")
+
+    counter = [0]
+    head = filter_stage(predicate, map_stage(func, count_batches(counter)))
+    start = time.perf_counter()
+    send_many(head, values, batch_size)
+    print(f"send_many({batch_size}):    {n / (time.perf_counter() - start):14,.0f} msg/s")
+
+
+# Task 13 Solution
+# Streaming statistics in O(1) memory: the "professional" running_stats.
+# - mean / variance with Welford's algorithm (no total**2 cancellation)
+# - min / max and an exponentially weighted moving average (EWMA)
+# - approximate quantiles with a small merging t-digest: values are kept as
+#   at most ~`compression` weighted centroids, small near the tails
+# - merge(): combine stats from separate shards/workers (Chan et al.),
+#   e.g. one StreamingStats per process, merged at the end
+#
+# The same object works three ways:
+#     stats.update(iterable)        # consume an iterator
+#     stats_receiver(stats)         # coroutine, one value per send()
+#     stats_sink(stats)             # batch sink for the Task 11 stages
+import math
+
+
+class StreamingStats:
+    def __init__(self, alpha=0.1, compression=100):
+        self.alpha = alpha
+        self.compression = compression
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared distances from the mean
+        self.min = math.inf
+        self.max = -math.inf
+        self.ewma = None
+        self.centroids = []  # sorted [mean, weight] pairs
+        self.buffer = []     # new values not yet folded into the centroids
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.ewma = value if self.ewma is None else self.ewma + self.alpha * (value - self.ewma)
+        self.buffer.append(value)
+        if len(self.buffer) >= self.compression * 10:
+            self._compress()
+
+    def update(self, values):
+        for value in values:
+            self.add(value)
+        return self
+
+    def _compress(self):
+        points = self.centroids + [[v, 1] for v in self.buffer]
+        self.buffer = []
+        if not points:
+            return
+        points.sort(key=lambda c: c[0])
+        total = sum(weight for _, weight in points)
+        merged = [list(points[0])]
+        seen = 0  # weight of all centroids before merged[-1]
+        limit = self._q_limit(0.0) * total
+        for mean, weight in points[1:]:
+            last = merged[-1]
+            if seen + last[1] + weight <= limit:
+                last[0] += (mean - last[0]) * weight / (last[1] + weight)
+                last[1] += weight
+            else:
+                seen += last[1]
+                limit = self._q_limit(seen / total) * total
+                merged.append([mean, weight])
+        self.centroids = merged
+
+    def _q_limit(self, q):
+        # Scale function k(q) = compression / pi * asin(2q - 1): a centroid
+        # starting at quantile q may grow until k has risen by 1. k spans
+        # `compression` in total and two neighbours always cover more than
+        # one unit, so at most ~compression centroids remain however many
+        # values were seen. k is steep near 0 and 1, so the tails stay small.
+        k = self.compression / math.pi * math.asin(2 * q - 1) + 1
+        if k >= self.compression / 2:
+            return 1.0
+        return (math.sin(k * math.pi / self.compression) + 1) / 2
+
+    def quantile(self, q):
+        self._compress()
+        if not self.centroids:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        target = q * self.count
+        seen = 0
+        prev_mean, prev_center = self.min, 0.0
+        for mean, weight in self.centroids:
+            center = seen + weight / 2
+            if target < center:
+                span = center - prev_center
+                if span <= 0:
+                    return mean
+                return prev_mean + (mean - prev_mean) * (target - prev_center) / span
+            seen += weight
+            prev_mean, prev_center = mean, center
+        span = self.count - prev_center
+        return prev_mean + (self.max - prev_mean) * (target - prev_center) / span
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.mean, self.m2, self.ewma = other.mean, other.m2, other.ewma
+        else:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self.m2 += other.m2 + delta * delta * self.count * other.count / total
+            # EWMA depends on arrival order; across shards use a count-weighted blend.
+            self.ewma = (self.ewma * self.count + other.ewma * other.count) / total
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        other._compress()
+        self.centroids = self.centroids + [list(c) for c in other.centroids]
+        self._compress()
+        return self
+
+    def summary(self):
+        # Same keys as task_15_stats_summary in module 19, plus the extras.
+        if self.count == 0:
+            return None
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "average": self.mean,
+            "stdev": self.stdev,
+            "ewma": self.ewma,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+@coroutine
+def stats_receiver(stats):
+    # send(value) returns the updated StreamingStats object.
+    while True:
+        stats.add((yield stats))
+
+
+@coroutine
+def stats_sink(stats):
+    while True:
+        stats.update((yield))
+
+
+stats = StreamingStats()
+receiver = stats_receiver(stats)
+for reading in (5, 15, 30):
+    receiver.send(reading)
+print("Streaming stats:", stats.summary())
+
+
 # ---------------------------------------------------------------------------
 # Final Notes
 # ---------------------------------------------------------------------------
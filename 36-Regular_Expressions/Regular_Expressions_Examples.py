@@ -97,9 +97,11 @@ print(parts)
 # Example 10: Email Validation
 # ---------------------------------------------------------------------------
 
+EMAIL_PATTERN = re.compile(r"\w+@\w+\.\w+")  # compiled once, reused per call
+
+
 def is_valid_email(email):
-    pattern = r"\w+@\w+\.\w+"
-    return re.fullmatch(pattern, email) is not None
+    return EMAIL_PATTERN.fullmatch(email) is not None
 
 print(is_valid_email("user@test.com"))
 print(is_valid_email("invalid-email"))
@@ -74,9 +74,13 @@ print(masked)
 
 
 # Task 8 Solution
+# Compiled once at import; re.fullmatch(pattern_string, ...) would look the
+# pattern up in re's internal cache on every call.
+PASSWORD_PATTERN = re.compile(r"^(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d]{8,}$")
+
+
 def is_valid_password(password):
-    pattern = r"^(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d]{8,}$"
-    return re.fullmatch(pattern, password) is not None
+    return PASSWORD_PATTERN.fullmatch(password) is not None
 
 print(is_valid_password("Pass1234"))
 print(is_valid_password("password"))